@@ -6,14 +6,18 @@ Provides SQLite database operations for storing and retrieving
 detection logs from the swine monitoring system.
 """
 
+import itertools
 import os
 import sqlite3
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional, Sequence
 
-import yaml
+from src.utils import get_base_dir, load_config_cached
 
-from src.utils import get_base_dir
+
+# SQLite's name for a private, non-persistent database
+MEMORY_DB = ":memory:"
+_memory_db_ids = itertools.count(1)
 
 
 def _load_db_path() -> Path:
@@ -27,8 +31,7 @@ def _load_db_path() -> Path:
     config_path = base_dir / "config.yaml"
     
     if config_path.exists():
-        with open(config_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+        config = load_config_cached(config_path)
     else:
         config = {}
     
@@ -44,7 +47,8 @@ class Database:
     Supports filtering by barn ID and date range.
     
     Attributes:
-        db_path: Path to the SQLite database file.
+        db_path: Path to the SQLite database file, or ":memory:" for a
+                 throwaway in-memory database (useful in tests).
         
     Examples:
         >>> db = Database()
@@ -52,17 +56,41 @@ class Database:
         >>> logs = db.get_logs(limit=10, barn_filter="Barn 1")
     """
     
-    def __init__(self, db_path: Optional[Path] = None) -> None:
+    # (cameras_version, camera rows) per database file, shared by all
+    # instances in the process. The version is bumped by triggers on every
+    # camera write, including writes from other processes or connections.
+    _camera_cache: dict[str, tuple[int, list[tuple[Any, ...]]]] = {}
+    
+    def __init__(self, db_path: Optional[Path | str] = None) -> None:
         """
         Initialize the database connection.
         
         Args:
-            db_path: Optional custom path to the database file.
+            db_path: Optional custom path to the database file, or
+                     ":memory:" for an in-memory database.
                      If not provided, uses path from config.yaml.
         """
         self.db_path = db_path or _load_db_path()
+        
+        # An in-memory database lives only as long as its connection, so
+        # one connection is kept open and shared by every method
+        self._memory_conn: Optional[sqlite3.Connection] = None
+        # Camera cache key: the resolved file path, so relative and absolute
+        # spellings share an entry; each in-memory database is its own store
+        if str(self.db_path) == MEMORY_DB:
+            self._memory_conn = sqlite3.connect(MEMORY_DB, check_same_thread=False)
+            self._cache_key = f"{MEMORY_DB}{next(_memory_db_ids)}"
+        else:
+            self._cache_key = str(Path(self.db_path).resolve())
+        
         self._init_db()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Return a connection to this database."""
+        if self._memory_conn is not None:
+            return self._memory_conn
+        return sqlite3.connect(self.db_path)
+
     def _init_db(self) -> None:
         """
         Initialize the database schema.
@@ -70,11 +98,16 @@ class Database:
         Creates the detections table if it doesn't exist and performs
         any necessary schema migrations.
         """
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        if self._memory_conn is None:
+            # A bare filename has no directory part to create
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
+            # WAL lets the GUI read while the video thread writes detections
+            cursor.execute("PRAGMA journal_mode=WAL")
+            
             # Create detections table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS detections (
@@ -111,6 +144,27 @@ class Database:
                     created_at TEXT DEFAULT (datetime('now', 'localtime'))
                 )
             """)
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cameras_source ON cameras(source)"
+            )
+            
+            # Single-row change counter for cameras, bumped by triggers so
+            # get_cameras_cached() notices writes made through any connection
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS cameras_version (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    version INTEGER NOT NULL
+                )
+            """)
+            cursor.execute("INSERT OR IGNORE INTO cameras_version (id, version) VALUES (1, 0)")
+            for event in ("INSERT", "UPDATE", "DELETE"):
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS cameras_version_{event.lower()}
+                    AFTER {event} ON cameras
+                    BEGIN
+                        UPDATE cameras_version SET version = version + 1 WHERE id = 1;
+                    END
+                """)
             
             conn.commit()
 
@@ -134,16 +188,32 @@ class Database:
             barn_id: Identifier for the barn/pen. Default is "Unknown".
             class_name: Name of the detected class. Default is "Unknown".
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+        self.log_detections([(image_path, confidence, is_mounting, details, barn_id, class_name)])
+
+    def log_detections(self, rows: Iterable[Sequence[Any]]) -> None:
+        """
+        Save several detection records in a single transaction.
+        
+        Args:
+            rows: Tuples in log_detection's argument order, i.e.
+                  (image_path, confidence, is_mounting, details[, barn_id[, class_name]]).
+                  Omitted barn_id/class_name default to "Unknown".
+                  
+        Examples:
+            >>> db.log_detections([("a.jpg", 0.9, True, "details", "Barn 1")])
+        """
+        defaults = ("Unknown", "Unknown")
+        params = [tuple(row) + defaults[len(row) - 4:] for row in rows]
+        
+        with self._connect() as conn:
+            conn.executemany(
                 """
                 INSERT INTO detections (
                     timestamp, image_path, confidence, is_mounting, details, barn_id, class_name
                 )
                 VALUES (datetime('now', 'localtime'), ?, ?, ?, ?, ?, ?)
                 """,
-                (image_path, confidence, is_mounting, details, barn_id, class_name),
+                params,
             )
             conn.commit()
 
@@ -171,7 +241,7 @@ class Database:
             List of tuples containing (id, timestamp, image_path,
             confidence, is_mounting, details, barn_id).
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Handle mixed timestamp formats (ISO string or Unix epoch)
@@ -229,7 +299,7 @@ class Database:
             bool: True if deletion was successful, False otherwise.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute("DELETE FROM detections WHERE id = ?", (detection_id,))
                 conn.commit()
@@ -251,14 +321,14 @@ class Database:
         Returns:
             int: The ID of the newly added camera.
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "INSERT INTO cameras (name, source, description) VALUES (?, ?, ?)",
                 (name, source, description)
             )
             conn.commit()
-            return cursor.lastrowid
+        return cursor.lastrowid
 
     def update_camera(self, camera_id: int, name: str, source: str, description: str = "") -> bool:
         """
@@ -273,14 +343,14 @@ class Database:
         Returns:
             bool: True if update was successful, False otherwise.
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "UPDATE cameras SET name = ?, source = ?, description = ? WHERE id = ?",
                 (name, source, description, camera_id)
             )
             conn.commit()
-            return cursor.rowcount > 0
+        return cursor.rowcount > 0
 
     def delete_camera(self, camera_id: int) -> bool:
         """
@@ -292,11 +362,11 @@ class Database:
         Returns:
             bool: True if deletion was successful, False otherwise.
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM cameras WHERE id = ?", (camera_id,))
             conn.commit()
-            return cursor.rowcount > 0
+        return cursor.rowcount > 0
 
     def get_cameras(self) -> list[tuple[Any, ...]]:
         """
@@ -305,7 +375,51 @@ class Database:
         Returns:
             List of tuples containing (id, name, source, description, created_at).
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT id, name, source, description, created_at FROM cameras ORDER BY id")
             return cursor.fetchall()
+
+    def camera_exists(self, source: str) -> bool:
+        """
+        Check whether a camera with the given source is registered.
+        
+        Args:
+            source: Source identifier to look up.
+            
+        Returns:
+            bool: True if at least one camera uses this source.
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1 FROM cameras WHERE source = ? LIMIT 1", (source,))
+            return cursor.fetchone() is not None
+
+    def get_cameras_cached(self) -> list[tuple[Any, ...]]:
+        """
+        Retrieve all cameras, reusing the last result until cameras change.
+        
+        The cache is shared by every Database instance pointing at the same
+        file. Each call reads the trigger-maintained cameras_version (one
+        scalar query) and only re-reads the table when it has changed, so
+        writes from other processes or connections are picked up too.
+        
+        Returns:
+            List of tuples containing (id, name, source, description, created_at).
+        """
+        key = self._cache_key
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT version FROM cameras_version WHERE id = 1")
+            version = cursor.fetchone()[0]
+            
+            cached = Database._camera_cache.get(key)
+            if cached is not None and cached[0] == version:
+                return list(cached[1])
+            
+            # Read in the same connection; a write landing in between only
+            # makes the next call refetch
+            cursor.execute("SELECT id, name, source, description, created_at FROM cameras ORDER BY id")
+            cameras = cursor.fetchall()
+        Database._camera_cache[key] = (version, cameras)
+        return list(cameras)
@@ -6,6 +6,7 @@ Provides real-time detection of pig mounting behavior using YOLO object detectio
 Handles video capture, inference, database logging, and notification dispatch.
 """
 
+import functools
 import os
 import re
 import time
@@ -14,7 +15,6 @@ from typing import Any, Optional
 
 import cv2
 import numpy as np
-import yaml
 from dotenv import load_dotenv
 from ultralytics import YOLO
 
@@ -22,7 +22,7 @@ from src.database import Database
 from src.logger_config import setup_logger
 from src.notification import Notifier
 from src.notification_scheduler import NotificationScheduler
-from src.utils import get_base_dir
+from src.utils import get_base_dir, load_config_cached
 
 # =============================================================================
 # Configuration Loading
@@ -37,16 +37,20 @@ BASE_DIR = get_base_dir()
 CONFIG_PATH = BASE_DIR / "config.yaml"
 
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> dict[str, Any]:
     """
     Load configuration from config.yaml.
 
+    The result is memoized for the life of the process; call
+    ``load_config.cache_clear()`` to force a re-read. Live reloads while
+    detecting go through get_latest_config() instead.
+
     Returns:
-        dict: Configuration dictionary.
+        dict: Configuration dictionary (shared; do not mutate).
     """
     if CONFIG_PATH.exists():
-        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+        return load_config_cached(CONFIG_PATH)
     return {
         "detection": {
             "model_path": "models/best.pt",
@@ -94,8 +98,7 @@ def get_latest_config():
             mtime = CONFIG_PATH.stat().st_mtime
             if mtime > config_mtime:
                 try:
-                    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-                        config = yaml.safe_load(f) or {}
+                    config = load_config_cached(CONFIG_PATH)
                     config_mtime = mtime
                     # logger.info("Configuration reloaded")
                 except Exception as e:
@@ -33,6 +33,7 @@ from dotenv import load_dotenv  # noqa: E402
 from src.gui.login_window import LoginWindow  # noqa: E402
 from src.gui.main_window import MainWindow  # noqa: E402
 from src.gui.setup_wizard import SetupWizard, is_first_run  # noqa: E402
+from src.logger_config import enable_queue_logging  # noqa: E402
 from src.utils import get_base_dir  # noqa: E402
 
 
@@ -45,6 +46,11 @@ class Application:
         self.login_window = None
         self.main_window = None
         
+        # Hand log I/O to a background listener so the UI thread never blocks.
+        # It is stopped (and flushed) at interpreter exit, after worker
+        # threads have had their last chance to log.
+        self.log_listener = enable_queue_logging()
+        
         # Load environment variables
         self.base_dir = get_base_dir()
         load_dotenv(self.base_dir / ".env")
@@ -1,3 +1,4 @@
+import logging
 import os
 from dotenv import load_dotenv
 from PyQt6.QtWidgets import (
@@ -24,10 +25,14 @@ from src.notification_scheduler import create_scheduler_from_env
 from .settings_window import SettingsWindow
 from .history_window import HistoryWindow
 from src.database import Database
+from src.detector import mask_password
 
 # Load .env file
 load_dotenv()
 
+# Logger
+logger = logging.getLogger("SwineMonitor.GUI")
+
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -299,6 +304,9 @@ class MainWindow(QMainWindow):
                     self.settings_window = SettingsWindow()
                     # Connect signal to reload scheduler when settings are saved
                     self.settings_window.settings_saved.connect(self._on_settings_saved)
+                elif not self.settings_window.isVisible():
+                    # Reuse the built widgets; just discard unsaved edits
+                    self.settings_window.load_current_settings()
                 self.settings_window.show()
                 self.settings_window.raise_()
                 self.settings_window.activateWindow()
@@ -323,7 +331,7 @@ class MainWindow(QMainWindow):
             load_dotenv(override=True)
 
             # Create and start new scheduler
-            self.scheduler = create_scheduler_from_env()
+            self.scheduler = create_scheduler_from_env(reload=True)
             if self.scheduler:
                 self.scheduler.set_notification_callback(self._on_notification_sent)
                 self.scheduler.start()
@@ -397,9 +405,15 @@ class MainWindow(QMainWindow):
     @pyqtSlot(QImage)
     def update_image(self, qt_image):
         """Display image sent from thread"""
+        width = self.video_screen.width()
+        height = self.video_screen.height()
+        # The thread pre-scales frames; keep it in step with label resizes
+        if self.thread is not None:
+            self.thread.set_display_size(width, height)
+        # No-op (shared data) when the frame already fits the label
         scaled_img = qt_image.scaled(
-            self.video_screen.width(),
-            self.video_screen.height(),
+            width,
+            height,
             Qt.AspectRatioMode.KeepAspectRatio,
         )
         self.video_screen.setPixmap(QPixmap.fromImage(scaled_img))
@@ -457,7 +471,7 @@ class MainWindow(QMainWindow):
         else:
             rtsp_url = source
 
-        print(f"[GUI] Start monitoring: {selection} ({rtsp_url})")
+        logger.info(f"Start monitoring: {selection} ({mask_password(rtsp_url)})")
 
         # 3. create and start thread (pass scheduler)
         self.thread = VideoThread(
@@ -465,6 +479,7 @@ class MainWindow(QMainWindow):
             barn_id=selection,
             scheduler=self.scheduler,
         )
+        self.thread.set_display_size(self.video_screen.width(), self.video_screen.height())
         self.thread.change_pixmap_signal.connect(self.update_image)
         self.thread.status_signal.connect(self.update_status_from_thread)
         self.thread.start()
@@ -482,7 +497,7 @@ class MainWindow(QMainWindow):
             self.thread.stop()
             self.thread = None
 
-        print("[GUI] Stop monitoring")
+        logger.info("Stop monitoring")
         self.update_status("Stopped")
         self.video_screen.setPixmap(QPixmap())
         self.video_screen.setText("Click 'Start' to begin monitoring")
@@ -516,7 +531,7 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """Handle window close event."""
-        print("[GUI] Closing application...")
+        logger.info("Closing application...")
 
         # Stop video thread if running
         if self.thread:
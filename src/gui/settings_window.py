@@ -5,8 +5,12 @@ Settings Window
 Configuration UI for detection parameters, email settings, and notification modes.
 """
 
+import copy
+import hmac
 import os
-import yaml
+import sys
+from dataclasses import dataclass
+from typing import Any, Callable
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -29,10 +33,134 @@ from PyQt6.QtWidgets import (
     QDialogButtonBox,
     QTextEdit,
 )
-from src.database import Database
 from PyQt6.QtCore import Qt, QTime, pyqtSignal
-from dotenv import load_dotenv, set_key
-from src.utils import get_base_dir
+from src.utils import get_base_dir, load_config_cached, save_yaml, update_env_file
+
+# Button styles, applied once on the window and matched by object name
+SETTINGS_STYLESHEET = """
+    QPushButton#btn_add_cam {
+        background-color: #4CAF50;
+        color: white;
+        font-weight: bold;
+    }
+    QPushButton#btn_del_cam {
+        background-color: #ffcccc;
+    }
+    QPushButton#btn_change_password {
+        background-color: #FF9800;
+        color: white;
+        font-weight: bold;
+        border-radius: 4px;
+    }
+    QPushButton#btn_change_password:hover {
+        background-color: #F57C00;
+    }
+    QPushButton#btn_save {
+        background-color: #4CAF50;
+        color: white;
+        font-weight: bold;
+        padding: 12px 24px;
+        border-radius: 4px;
+    }
+    QPushButton#btn_save:hover {
+        background-color: #45a049;
+    }
+    QPushButton#btn_cancel {
+        background-color: #9e9e9e;
+        color: white;
+        font-weight: bold;
+        padding: 12px 24px;
+        border-radius: 4px;
+    }
+    QPushButton#btn_cancel:hover {
+        background-color: #757575;
+    }
+"""
+
+# Camera list label, e.g. "Barn 1 (rtsp://...)"
+_CAM_LABEL_FMT = "{} ({})".format
+
+
+def _set_time_text(widget, value):
+    """Set a QTimeEdit from an "HH:MM" string, ignoring malformed values."""
+    try:
+        h, m = map(int, value.split(":"))
+        widget.setTime(QTime(h, m))
+    except (ValueError, IndexError):
+        pass
+
+
+def _make_line_edit(
+    placeholder="",
+    *,
+    text="",
+    min_width=300,
+    min_height=30,
+    password=False,
+    ime_hints=None,
+):
+    """Create a QLineEdit configured in one place; zero/None options are skipped."""
+    edit = QLineEdit(text)
+    edit.setPlaceholderText(placeholder)
+    if password:
+        edit.setEchoMode(QLineEdit.EchoMode.Password)
+    if min_width:
+        edit.setMinimumWidth(min_width)
+    if min_height:
+        edit.setMinimumHeight(min_height)
+    if ime_hints is not None:
+        edit.setInputMethodHints(ime_hints)
+    return edit
+
+
+def _make_form(spacing=None, expanding=False):
+    """Create a QFormLayout; expanding forms grow fields and right-align labels."""
+    form = QFormLayout()
+    if expanding:
+        form.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
+        form.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
+    if spacing is not None:
+        form.setSpacing(spacing)
+    return form
+
+
+@dataclass(frozen=True)
+class EnvBinding:
+    """Binds a settings widget to the .env key it is loaded from and saved to."""
+    
+    tab: str
+    widget_attr: str
+    env_key: str
+    default: str
+    getter: Callable[[Any], str]
+    setter: Callable[[Any, str], None]
+
+
+_TEXT = (QLineEdit.text, QLineEdit.setText)
+_INT = (lambda w: str(w.value()), lambda w, v: w.setValue(int(v)))
+_FLAG_VALUES = ("false", "true")  # indexed by QCheckBox.isChecked()
+_FLAG = (
+    lambda w: _FLAG_VALUES[w.isChecked()],
+    lambda w, v: w.setChecked(v.lower() == "true"),
+)
+_TIME = (lambda w: w.time().toString("HH:mm"), _set_time_text)
+
+ENV_BINDINGS = [
+    # Email tab
+    EnvBinding("email", "edit_smtp_host", "SMTP_HOST", "smtp.gmail.com", *_TEXT),
+    EnvBinding("email", "spin_smtp_port", "SMTP_PORT", "587", *_INT),
+    EnvBinding("email", "edit_smtp_user", "SMTP_USER", "", *_TEXT),
+    EnvBinding("email", "edit_smtp_password", "SMTP_PASSWORD", "", *_TEXT),
+    EnvBinding("email", "edit_recipient", "RECIPIENT_EMAIL", "", *_TEXT),
+    EnvBinding("email", "chk_email_enabled", "EMAIL_ENABLED", "true", *_FLAG),
+    # Notification tab
+    EnvBinding("notification", "chk_master_notify", "NOTIFICATIONS_ENABLED", "true", *_FLAG),
+    EnvBinding("notification", "chk_immediate", "IMMEDIATE_ENABLED", "true", *_FLAG),
+    EnvBinding("notification", "chk_daily", "DAILY_SUMMARY_ENABLED", "false", *_FLAG),
+    EnvBinding("notification", "time_daily", "DAILY_SUMMARY_TIME", "09:00", *_TIME),
+    EnvBinding("notification", "edit_discord_url", "DISCORD_WEBHOOK_URL", "", *_TEXT),
+    EnvBinding("notification", "chk_discord_enabled", "DISCORD_ENABLED", "false", *_FLAG),
+]
 
 
 class SettingsWindow(QWidget):
@@ -45,6 +173,8 @@ class SettingsWindow(QWidget):
         super().__init__()
         self.setWindowTitle("System Settings")
         self.resize(550, 550)
+        self.setObjectName("SettingsWindow")
+        self.setStyleSheet(SETTINGS_STYLESHEET)
         
         # Paths
         self.base_dir = get_base_dir()
@@ -52,10 +182,16 @@ class SettingsWindow(QWidget):
         self.env_path = self.base_dir / ".env"
         
         # Load environment
+        from dotenv import load_dotenv
+        
         load_dotenv(self.env_path)
+        self._admin_password = os.getenv("ADMIN_PASSWORD", "admin")
+        
+        # Database is opened on first use (see the db property)
+        self._db = None
         
-        # Initialize Database
-        self.db = Database()
+        # Set when a detection-tab field is edited; save skips config.yaml otherwise
+        self._config_dirty = False
         
         # Main layout with tabs
         self.main_layout = QVBoxLayout(self)
@@ -64,30 +200,58 @@ class SettingsWindow(QWidget):
         self.tabs = QTabWidget()
         self.main_layout.addWidget(self.tabs)
         
-        # Create tabs
-        self.create_detection_tab()
-        self.create_camera_tab()
-        self.create_email_tab()
-        self.create_notification_tab()
-        self.create_security_tab()
+        # Create placeholder tabs; contents are built on first visit
+        self._tab_specs = [
+            ("detection", "Detection", self.create_detection_tab),
+            ("cameras", "Cameras", self.create_camera_tab),
+            ("email", "Email", self.create_email_tab),
+            ("notification", "Notification", self.create_notification_tab),
+            ("security", "Security", self.create_security_tab),
+        ]
+        self._tab_pages = {}
+        self._built_tabs = set()
+        for key, title, _ in self._tab_specs:
+            page = QWidget()
+            self._tab_pages[key] = page
+            self.tabs.addTab(page, title)
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
         
         # Buttons
         self.create_buttons()
         
-        # Load settings
+        # Load settings, then build the initially visible tab
         self.load_current_settings()
+        self._ensure_tab_built(self.tabs.currentIndex())
+    
+    @property
+    def db(self):
+        """Database handle, created the first time cameras are accessed."""
+        if self._db is None:
+            from src.database import Database
+            
+            self._db = Database()
+        return self._db
     
-    def create_detection_tab(self):
-        """Create detection settings tab."""
-        tab = QWidget()
+    def _ensure_tab_built(self, index):
+        """Build a tab's widgets the first time it is shown."""
+        if index < 0 or index >= len(self._tab_specs):
+            return
+        key, _, builder = self._tab_specs[index]
+        if key in self._built_tabs:
+            return
+        
+        builder(self._tab_pages[key])
+        self._built_tabs.add(key)
+        self._load_tab_settings(key)
+    
+    def create_detection_tab(self, tab):
+        """Build detection settings tab contents."""
         layout = QVBoxLayout(tab)
         layout.setSpacing(15)
         
         # Detection Parameters
         group = QGroupBox("Detection Parameters")
-        form = QFormLayout()
-        form.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
-        form.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
+        form = _make_form(expanding=True)
         
         # Confidence threshold
         self.spin_conf = QDoubleSpinBox()
@@ -106,7 +270,10 @@ class SettingsWindow(QWidget):
             "Pig (Class 0)": 0,
             "Mounting (Class 1)": 1,
         }
-        self.combo_target_class.addItems(list(self.class_mapping.keys()))
+        self._class_id_to_index = {
+            class_id: i for i, class_id in enumerate(self.class_mapping.values())
+        }
+        self.combo_target_class.addItems(list(self.class_mapping))
         self.combo_target_class.setToolTip("Select the behavior to detect")
         form.addRow("Target Class:", self.combo_target_class)
         
@@ -133,20 +300,28 @@ class SettingsWindow(QWidget):
         self.spin_cooldown.setToolTip("Minimum time between notifications")
         form.addRow("Notification Cooldown:", self.spin_cooldown)
         
+        # Any edit marks config.yaml as needing a save
+        self.spin_conf.valueChanged.connect(self._mark_config_dirty)
+        self.combo_target_class.currentIndexChanged.connect(self._mark_config_dirty)
+        self.edit_model.textChanged.connect(self._mark_config_dirty)
+        self.spin_cooldown.valueChanged.connect(self._mark_config_dirty)
+        
         group.setLayout(form)
         layout.addWidget(group)
         layout.addStretch()
-        
-        self.tabs.addTab(tab, "Detection")
+    
+    def _mark_config_dirty(self, *_):
+        """Record that a config.yaml-backed field was edited."""
+        self._config_dirty = True
 
-    def create_camera_tab(self):
-        """Create camera management tab."""
-        tab = QWidget()
+    def create_camera_tab(self, tab):
+        """Build camera management tab contents."""
         layout = QVBoxLayout(tab)
         
         # Camera List
         self.camera_list = QListWidget()
         self.camera_list.setAlternatingRowColors(True)
+        self.camera_list.setUniformItemSizes(True)  # All rows are single-line
         layout.addWidget(QLabel("Registered Cameras:"))
         layout.addWidget(self.camera_list)
         
@@ -154,14 +329,14 @@ class SettingsWindow(QWidget):
         btn_layout = QHBoxLayout()
         
         self.btn_add_cam = QPushButton("Add Camera")
-        self.btn_add_cam.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold;")
+        self.btn_add_cam.setObjectName("btn_add_cam")
         self.btn_add_cam.clicked.connect(self._add_camera)
         
         self.btn_edit_cam = QPushButton("Edit Camera")
         self.btn_edit_cam.clicked.connect(self._edit_camera)
         
         self.btn_del_cam = QPushButton("Delete Camera")
-        self.btn_del_cam.setStyleSheet("background-color: #ffcccc;")
+        self.btn_del_cam.setObjectName("btn_del_cam")
         self.btn_del_cam.clicked.connect(self._delete_camera)
         
         btn_layout.addWidget(self.btn_add_cam)
@@ -170,20 +345,26 @@ class SettingsWindow(QWidget):
         
         layout.addLayout(btn_layout)
         
-        self.tabs.addTab(tab, "Cameras")
         self._load_cameras()
 
     def _load_cameras(self):
         """Load cameras from database into list."""
-        self.camera_list.clear()
-        cameras = self.db.get_cameras()
-        
-        for cam in cameras:
-            # cam: (id, name, source, description, created_at)
-            item = QListWidgetItem(f"{cam[1]} ({cam[2]})")
-            item.setData(Qt.ItemDataRole.UserRole, cam)  # Store full camera data
-            item.setToolTip(cam[3])
-            self.camera_list.addItem(item)
+        cameras = self.db.get_cameras_cached()
+        
+        # Repopulate with repaints and signals suspended (one layout pass)
+        self.camera_list.setUpdatesEnabled(False)
+        self.camera_list.blockSignals(True)
+        try:
+            self.camera_list.clear()
+            for cam_id, name, source, description, *_ in cameras:
+                item = QListWidgetItem(_CAM_LABEL_FMT(name, source))
+                # Store (id, name, source, description) for edit/delete
+                item.setData(Qt.ItemDataRole.UserRole, (cam_id, name, source, description))
+                item.setToolTip(description)
+                self.camera_list.addItem(item)
+        finally:
+            self.camera_list.blockSignals(False)
+            self.camera_list.setUpdatesEnabled(True)
 
     def _add_camera(self):
         """Show dialog to add a new camera."""
@@ -240,13 +421,19 @@ class SettingsWindow(QWidget):
         if not start_dir.exists():
             start_dir = self.base_dir
         
-        # Use Qt dialog instead of native dialog to avoid macOS freeze
+        # The Qt-drawn dialog is only needed to avoid a native dialog
+        # freeze on macOS; elsewhere the native dialog opens faster
+        if sys.platform == "darwin":
+            options = QFileDialog.Option.DontUseNativeDialog
+        else:
+            options = QFileDialog.Option(0)
+        
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select YOLO Model",
             str(start_dir),
             "PyTorch Models (*.pt);;ONNX Models (*.onnx);;All Files (*)",
-            options=QFileDialog.Option.DontUseNativeDialog
+            options=options
         )
         
         if file_path:
@@ -257,27 +444,19 @@ class SettingsWindow(QWidget):
             except ValueError:
                 self.edit_model.setText(file_path)
     
-    def create_email_tab(self):
-        """Create email settings tab."""
-        tab = QWidget()
+    def create_email_tab(self, tab):
+        """Build email settings tab contents."""
         layout = QVBoxLayout(tab)
         layout.setSpacing(15)
         
         # SMTP Settings
         group = QGroupBox("Email Configuration (Gmail)")
-        form = QFormLayout()
-        form.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
-        form.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
-        form.setSpacing(12)
+        form = _make_form(spacing=12, expanding=True)
         
         self.chk_email_enabled = QCheckBox("Enable Email Notifications")
         form.addRow("", self.chk_email_enabled)
         
-        self.edit_smtp_host = QLineEdit()
-        self.edit_smtp_host.setText("smtp.gmail.com")
-        self.edit_smtp_host.setPlaceholderText("smtp.gmail.com")
-        self.edit_smtp_host.setMinimumWidth(300)
-        self.edit_smtp_host.setMinimumHeight(30)
+        self.edit_smtp_host = _make_line_edit("smtp.gmail.com", text="smtp.gmail.com")
         form.addRow("SMTP Host:", self.edit_smtp_host)
         
         self.spin_smtp_port = QSpinBox()
@@ -286,23 +465,15 @@ class SettingsWindow(QWidget):
         self.spin_smtp_port.setMinimumHeight(30)
         form.addRow("SMTP Port:", self.spin_smtp_port)
         
-        self.edit_smtp_user = QLineEdit()
-        self.edit_smtp_user.setPlaceholderText("your-email@gmail.com")
-        self.edit_smtp_user.setMinimumWidth(300)
-        self.edit_smtp_user.setMinimumHeight(30)
+        self.edit_smtp_user = _make_line_edit("your-email@gmail.com")
         form.addRow("Email Address:", self.edit_smtp_user)
         
-        self.edit_smtp_password = QLineEdit()
-        self.edit_smtp_password.setEchoMode(QLineEdit.EchoMode.Password)
-        self.edit_smtp_password.setPlaceholderText("App Password (16 characters)")
-        self.edit_smtp_password.setMinimumWidth(300)
-        self.edit_smtp_password.setMinimumHeight(30)
+        self.edit_smtp_password = _make_line_edit(
+            "App Password (16 characters)", password=True
+        )
         form.addRow("App Password:", self.edit_smtp_password)
         
-        self.edit_recipient = QLineEdit()
-        self.edit_recipient.setPlaceholderText("recipient@example.com")
-        self.edit_recipient.setMinimumWidth(300)
-        self.edit_recipient.setMinimumHeight(30)
+        self.edit_recipient = _make_line_edit("recipient@example.com")
         form.addRow("Recipient Email:", self.edit_recipient)
         
         group.setLayout(form)
@@ -314,12 +485,9 @@ class SettingsWindow(QWidget):
         layout.addWidget(self.btn_test_email)
         
         layout.addStretch()
-        
-        self.tabs.addTab(tab, "Email")
     
-    def create_notification_tab(self):
-        """Create notification mode settings tab."""
-        tab = QWidget()
+    def create_notification_tab(self, tab):
+        """Build notification mode settings tab contents."""
         layout = QVBoxLayout(tab)
         layout.setSpacing(15)
         
@@ -332,8 +500,7 @@ class SettingsWindow(QWidget):
         
         # Notification Mode
         group_mode = QGroupBox("Notification Mode")
-        form_mode = QFormLayout()
-        form_mode.setSpacing(10)
+        form_mode = _make_form(spacing=10)
         
         self.chk_immediate = QCheckBox("Send Immediate Alerts")
         self.chk_immediate.setToolTip("Sends a notification as soon as mating behavior is detected.")
@@ -355,8 +522,7 @@ class SettingsWindow(QWidget):
         
         # Time Settings (will be shown/hidden based on mode)
         self.group_time = QGroupBox("Schedule Settings")
-        form_time = QFormLayout()
-        form_time.setSpacing(10)
+        form_time = _make_form(spacing=10)
         
         # Daily time row
         self.time_daily_label = QLabel("Daily Summary Time:")
@@ -371,16 +537,12 @@ class SettingsWindow(QWidget):
         
         # Discord Settings
         group_discord = QGroupBox("Discord (Optional)")
-        form_discord = QFormLayout()
-        form_discord.setSpacing(10)
+        form_discord = _make_form(spacing=10)
         
         self.chk_discord_enabled = QCheckBox("Enable Discord Notifications")
         form_discord.addRow("", self.chk_discord_enabled)
         
-        self.edit_discord_url = QLineEdit()
-        self.edit_discord_url.setPlaceholderText("https://discord.com/api/webhooks/...")
-        self.edit_discord_url.setMinimumWidth(300)
-        self.edit_discord_url.setMinimumHeight(30)
+        self.edit_discord_url = _make_line_edit("https://discord.com/api/webhooks/...")
         form_discord.addRow("Webhook URL:", self.edit_discord_url)
         
         group_discord.setLayout(form_discord)
@@ -388,8 +550,6 @@ class SettingsWindow(QWidget):
         
         layout.addStretch()
         
-        self.tabs.addTab(tab, "Notification")
-        
         # Initial visibility update
         self._update_time_visibility()
 
@@ -398,50 +558,43 @@ class SettingsWindow(QWidget):
         self.chk_immediate.setEnabled(checked)
         self.chk_daily.setEnabled(checked)
         self.group_time.setEnabled(checked)
-        self.chk_email_enabled.setEnabled(checked)
         self.chk_discord_enabled.setEnabled(checked)
+        if "email" in self._built_tabs:
+            self.chk_email_enabled.setEnabled(checked)
         
     def _update_time_visibility(self):
         """Show/hide time settings based on daily mode."""
         show_daily = self.chk_daily.isChecked()
         self.group_time.setVisible(show_daily)
     
-    def create_security_tab(self):
-        """Create security settings tab for password change."""
-        tab = QWidget()
+    def create_security_tab(self, tab):
+        """Build security settings tab contents for password change."""
         layout = QVBoxLayout(tab)
         layout.setSpacing(15)
         
         # Password Change Group
         group = QGroupBox("Change Admin Password")
-        form = QFormLayout()
-        form.setSpacing(12)
+        form = _make_form(spacing=12)
         
         # IME disable hints
         ime_hints = Qt.InputMethodHint.ImhLatinOnly | Qt.InputMethodHint.ImhPreferLowercase
         
         # Current password
-        self.edit_current_password = QLineEdit()
-        self.edit_current_password.setEchoMode(QLineEdit.EchoMode.Password)
-        self.edit_current_password.setPlaceholderText("Enter current password")
-        self.edit_current_password.setMinimumHeight(35)
-        self.edit_current_password.setInputMethodHints(ime_hints)
+        self.edit_current_password = _make_line_edit(
+            "Enter current password", min_width=0, min_height=35, password=True, ime_hints=ime_hints
+        )
         form.addRow("Current Password:", self.edit_current_password)
         
         # New password
-        self.edit_new_password = QLineEdit()
-        self.edit_new_password.setEchoMode(QLineEdit.EchoMode.Password)
-        self.edit_new_password.setPlaceholderText("Enter new password")
-        self.edit_new_password.setMinimumHeight(35)
-        self.edit_new_password.setInputMethodHints(ime_hints)
+        self.edit_new_password = _make_line_edit(
+            "Enter new password", min_width=0, min_height=35, password=True, ime_hints=ime_hints
+        )
         form.addRow("New Password:", self.edit_new_password)
         
         # Confirm new password
-        self.edit_confirm_password = QLineEdit()
-        self.edit_confirm_password.setEchoMode(QLineEdit.EchoMode.Password)
-        self.edit_confirm_password.setPlaceholderText("Confirm new password")
-        self.edit_confirm_password.setMinimumHeight(35)
-        self.edit_confirm_password.setInputMethodHints(ime_hints)
+        self.edit_confirm_password = _make_line_edit(
+            "Confirm new password", min_width=0, min_height=35, password=True, ime_hints=ime_hints
+        )
         form.addRow("Confirm Password:", self.edit_confirm_password)
         
         # Password requirements note
@@ -460,30 +613,19 @@ class SettingsWindow(QWidget):
         # Change Password Button
         self.btn_change_password = QPushButton("Change Password")
         self.btn_change_password.setMinimumHeight(40)
-        self.btn_change_password.setStyleSheet("""
-            QPushButton {
-                background-color: #FF9800;
-                color: white;
-                font-weight: bold;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #F57C00;
-            }
-        """)
+        self.btn_change_password.setObjectName("btn_change_password")
         self.btn_change_password.clicked.connect(self._change_password)
         layout.addWidget(self.btn_change_password)
         
         layout.addStretch()
-        
-        self.tabs.addTab(tab, "Security")
     
     def _change_password(self):
         """Handle password change."""
-        current_password = os.getenv("ADMIN_PASSWORD", "admin")
-        
-        # Validate current password
-        if self.edit_current_password.text() != current_password:
+        # Validate current password (constant-time compare)
+        if not hmac.compare_digest(
+            self.edit_current_password.text().encode("utf-8"),
+            self._admin_password.encode("utf-8"),
+        ):
             QMessageBox.warning(self, "Error", "Current password is incorrect.")
             return
         
@@ -501,7 +643,10 @@ class SettingsWindow(QWidget):
         
         # Save new password
         try:
+            from dotenv import set_key
+            
             set_key(str(self.env_path), "ADMIN_PASSWORD", new_password)
+            self._admin_password = new_password
             
             # Clear password fields
             self.edit_current_password.clear()
@@ -522,33 +667,11 @@ class SettingsWindow(QWidget):
         btn_layout = QHBoxLayout()
         
         self.btn_save = QPushButton("Save Settings")
-        self.btn_save.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                font-weight: bold;
-                padding: 12px 24px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        self.btn_save.setObjectName("btn_save")
         self.btn_save.clicked.connect(self.save_settings)
         
         self.btn_cancel = QPushButton("Cancel")
-        self.btn_cancel.setStyleSheet("""
-            QPushButton {
-                background-color: #9e9e9e;
-                color: white;
-                font-weight: bold;
-                padding: 12px 24px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #757575;
-            }
-        """)
+        self.btn_cancel.setObjectName("btn_cancel")
         self.btn_cancel.clicked.connect(self.close)
         
         btn_layout.addStretch()
@@ -558,76 +681,85 @@ class SettingsWindow(QWidget):
         self.main_layout.addLayout(btn_layout)
     
     def load_current_settings(self):
-        """Load current settings from config.yaml and .env."""
+        """Load current settings from config.yaml and .env into built tabs."""
         # Load config.yaml
+        self.config_data = {}
         if self.config_path.exists():
             try:
-                with open(self.config_path, "r") as f:
-                    self.config_data = yaml.safe_load(f) or {}
-                
-                # Detection settings
-                det = self.config_data.get("detection", {})
-                self.spin_conf.setValue(det.get("confidence_threshold", 0.5))
-                
-                # Set target class dropdown by matching class ID
-                target_id = det.get("target_class", 0)
-                for i, (name, class_id) in enumerate(self.class_mapping.items()):
-                    if class_id == target_id:
-                        self.combo_target_class.setCurrentIndex(i)
-                        break
-                
-                self.edit_model.setText(det.get("model_path", "models/best.pt"))
-                
-                # Notification cooldown
-                notif = self.config_data.get("notification", {})
-                self.spin_cooldown.setValue(notif.get("cooldown", 30))
-                
+                self.config_data = load_config_cached(self.config_path)
             except Exception as e:
                 QMessageBox.warning(self, "Warning", f"Could not load config.yaml: {e}")
-                self.config_data = {}
-        else:
-            self.config_data = {}
-        
-        # Load .env settings
-        self.edit_smtp_host.setText(os.getenv("SMTP_HOST", "smtp.gmail.com"))
-        self.spin_smtp_port.setValue(int(os.getenv("SMTP_PORT", "587")))
-        self.edit_smtp_user.setText(os.getenv("SMTP_USER", ""))
-        self.edit_smtp_password.setText(os.getenv("SMTP_PASSWORD", ""))
-        self.edit_recipient.setText(os.getenv("RECIPIENT_EMAIL", ""))
-        self.chk_email_enabled.setChecked(bool(os.getenv("SMTP_USER")))
+        # Last-saved state, used to skip rewriting an unchanged config.yaml
+        self._saved_config = copy.deepcopy(self.config_data)
         
-        # Notification Settings
-        master = os.getenv("NOTIFICATIONS_ENABLED", "true").lower() == "true"
-        self.chk_master_notify.setChecked(master)
+        # Snapshot the environment once for all tab loaders
+        self._env = dict(os.environ)
         
-        immediate = os.getenv("IMMEDIATE_ENABLED", "true").lower() == "true"
-        self.chk_immediate.setChecked(immediate)
+        for key in self._built_tabs:
+            self._load_tab_settings(key)
+    
+    def _load_tab_settings(self, key):
+        """Populate a built tab's widgets from the loaded settings."""
+        if key == "detection":
+            self._load_detection_settings()
+            return
         
-        daily = os.getenv("DAILY_SUMMARY_ENABLED", "false").lower() == "true"
-        self.chk_daily.setChecked(daily)
+        env = self._env
+        bindings = [b for b in ENV_BINDINGS if b.tab == key]
+        widgets = [getattr(self, b.widget_attr) for b in bindings]
         
-        # Time settings
-        daily_time = os.getenv("DAILY_SUMMARY_TIME", "09:00")
+        # Suppress toggled/changed handlers while loading; the dependent
+        # state is applied once below
+        for widget in widgets:
+            widget.blockSignals(True)
         try:
-            h, m = map(int, daily_time.split(":"))
-            self.time_daily.setTime(QTime(h, m))
-        except (ValueError, IndexError):
-            pass
-
-        # Apply state
-        self._toggle_notifications(master)
-        self._update_time_visibility()
+            for binding, widget in zip(bindings, widgets):
+                binding.setter(widget, env.get(binding.env_key, binding.default))
+        finally:
+            for widget in widgets:
+                widget.blockSignals(False)
+        
+        if key == "email":
+            # Email only counts as enabled when an SMTP user is configured
+            if not env.get("SMTP_USER"):
+                self.chk_email_enabled.setChecked(False)
+            
+            # Follow the master notification switch
+            if "notification" in self._built_tabs:
+                master = self.chk_master_notify.isChecked()
+            else:
+                master = env.get("NOTIFICATIONS_ENABLED", "true").lower() == "true"
+            self.chk_email_enabled.setEnabled(master)
+        
+        elif key == "notification":
+            # Discord only counts as enabled when a webhook URL is configured
+            if not env.get("DISCORD_WEBHOOK_URL"):
+                self.chk_discord_enabled.setChecked(False)
+            
+            # Apply state
+            self._toggle_notifications(self.chk_master_notify.isChecked())
+            self._update_time_visibility()
+    
+    def _load_detection_settings(self):
+        """Populate detection tab from config.yaml."""
+        # Detection settings
+        det = self.config_data.get("detection", {})
+        self.spin_conf.setValue(det.get("confidence_threshold", 0.5))
+        
+        # Set target class dropdown by matching class ID
+        target_id = det.get("target_class", 0)
+        index = self._class_id_to_index.get(target_id)
+        if index is not None:
+            self.combo_target_class.setCurrentIndex(index)
         
-        # Email enabled (default to true if SMTP_USER is set)
-        email_enabled = os.getenv("EMAIL_ENABLED", "true").lower() == "true"
-        has_smtp_user = bool(os.getenv("SMTP_USER"))
-        self.chk_email_enabled.setChecked(email_enabled and has_smtp_user)
+        self.edit_model.setText(det.get("model_path", "models/best.pt"))
         
-        # Discord settings
-        discord_url = os.getenv("DISCORD_WEBHOOK_URL", "")
-        discord_enabled = os.getenv("DISCORD_ENABLED", "false").lower() == "true"
-        self.edit_discord_url.setText(discord_url)
-        self.chk_discord_enabled.setChecked(discord_enabled and bool(discord_url))
+        # Notification cooldown
+        notif = self.config_data.get("notification", {})
+        self.spin_cooldown.setValue(notif.get("cooldown", 30))
+        
+        # Loading is not an edit
+        self._config_dirty = False
     
     def test_email_connection(self):
         """Test SMTP connection with current settings."""
@@ -672,62 +804,56 @@ class SettingsWindow(QWidget):
     def save_settings(self):
         """Save all settings to config.yaml and .env."""
         try:
-            # Track if model path changed (requires restart)
-            old_model_path = self.config_data.get("detection", {}).get("model_path", "")
-            new_model_path = self.edit_model.text()
-            model_changed = old_model_path != new_model_path
-            
-            # === Save to config.yaml ===
-            if "detection" not in self.config_data:
-                self.config_data["detection"] = {}
-            if "notification" not in self.config_data:
-                self.config_data["notification"] = {}
-            
-            self.config_data["detection"]["confidence_threshold"] = round(
-                self.spin_conf.value(), 2
-            )
-            # Get target class ID from combo box selection
-            selected_class_name = self.combo_target_class.currentText()
-            target_class_id = self.class_mapping.get(selected_class_name, 0)
-            self.config_data["detection"]["target_class"] = target_class_id
-            self.config_data["detection"]["model_path"] = new_model_path
-            self.config_data["notification"]["cooldown"] = self.spin_cooldown.value()
-            
-            with open(self.config_path, "w") as f:
-                yaml.dump(self.config_data, f, default_flow_style=False, sort_keys=False)
+            model_changed = False
             
-            # === Save to .env ===
-            env_file = str(self.env_path)
-            
-            # Email settings
-            set_key(env_file, "SMTP_HOST", self.edit_smtp_host.text())
-            set_key(env_file, "SMTP_PORT", str(self.spin_smtp_port.value()))
-            set_key(env_file, "SMTP_USER", self.edit_smtp_user.text())
-            set_key(env_file, "SMTP_PASSWORD", self.edit_smtp_password.text())
-            set_key(env_file, "RECIPIENT_EMAIL", self.edit_recipient.text())
-            
-            # Notification settings
-            master_enabled = "true" if self.chk_master_notify.isChecked() else "false"
-            set_key(env_file, "NOTIFICATIONS_ENABLED", master_enabled)
-            
-            immediate_enabled = "true" if self.chk_immediate.isChecked() else "false"
-            set_key(env_file, "IMMEDIATE_ENABLED", immediate_enabled)
-            
-            daily_enabled = "true" if self.chk_daily.isChecked() else "false"
-            set_key(env_file, "DAILY_SUMMARY_ENABLED", daily_enabled)
-            
-            # Time settings
-            daily_time = self.time_daily.time().toString("HH:mm")
-            set_key(env_file, "DAILY_SUMMARY_TIME", daily_time)
+            # === Save to config.yaml (skipped when no detection field was edited) ===
+            if self._config_dirty:
+                # Track if model path changed (requires restart)
+                old_model_path = self.config_data.get("detection", {}).get("model_path", "")
+                new_model_path = self.edit_model.text()
+                model_changed = old_model_path != new_model_path
+                
+                if "detection" not in self.config_data:
+                    self.config_data["detection"] = {}
+                if "notification" not in self.config_data:
+                    self.config_data["notification"] = {}
+                
+                self.config_data["detection"]["confidence_threshold"] = round(
+                    self.spin_conf.value(), 2
+                )
+                # Get target class ID from combo box selection
+                selected_class_name = self.combo_target_class.currentText()
+                target_class_id = self.class_mapping.get(selected_class_name, 0)
+                self.config_data["detection"]["target_class"] = target_class_id
+                self.config_data["detection"]["model_path"] = new_model_path
+                self.config_data["notification"]["cooldown"] = self.spin_cooldown.value()
+                
+                # Edits that were reverted still leave the file untouched
+                if self.config_data != self._saved_config:
+                    save_yaml(self.config_path, self.config_data)
+                    self._saved_config = copy.deepcopy(self.config_data)
+                self._config_dirty = False
             
-            # Email enabled flag
-            email_enabled = "true" if self.chk_email_enabled.isChecked() else "false"
-            set_key(env_file, "EMAIL_ENABLED", email_enabled)
+            # === Save to .env (single rewrite) ===
+            # Only tabs that were opened can have changed values
+            env_updates = {
+                binding.env_key: binding.getter(getattr(self, binding.widget_attr))
+                for binding in ENV_BINDINGS
+                if binding.tab in self._built_tabs
+            }
             
-            # Discord settings
-            set_key(env_file, "DISCORD_WEBHOOK_URL", self.edit_discord_url.text())
-            discord_enabled = "true" if self.chk_discord_enabled.isChecked() else "false"
-            set_key(env_file, "DISCORD_ENABLED", discord_enabled)
+            # Write only keys whose values differ from the current .env
+            if env_updates:
+                from dotenv import dotenv_values
+                
+                current_env = dotenv_values(self.env_path) if self.env_path.exists() else {}
+                changed_env = {
+                    key: value
+                    for key, value in env_updates.items()
+                    if current_env.get(key) != value
+                }
+                if changed_env:
+                    update_env_file(self.env_path, changed_env)
             
             # Emit signal to notify main window
             self.settings_saved.emit()
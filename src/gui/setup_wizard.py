@@ -5,7 +5,10 @@ First-run configuration wizard for new installations.
 Guides users through initial setup of the application.
 """
 
+import functools
+import hmac
 import os
+import sys
 from PyQt6.QtWidgets import (
     QWizard,
     QWizardPage,
@@ -21,11 +24,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
-from dotenv import set_key
-import yaml
-
-from src.utils import get_base_dir
-from src.database import Database
+from src.utils import get_base_dir, load_yaml, save_yaml, update_env_file
 
 
 class SetupWizard(QWizard):
@@ -96,7 +95,9 @@ class SetupWizard(QWizard):
         self.addPage(WelcomePage())
         self.addPage(PasswordPage())
         self.addPage(CameraPage())
-        self.addPage(ModelPage(self.base_dir))
+        # Kept as an attribute so CompletePage can read it without a page scan
+        self.model_page = ModelPage(self.base_dir)
+        self.addPage(self.model_page)
         self.addPage(EmailPage())
         self.addPage(CompletePage())
 
@@ -158,6 +159,7 @@ class PasswordPage(QWizardPage):
         super().__init__()
         self.setTitle("Admin Password")
         self.setSubTitle("Set a password for accessing the application")
+        self._last_validated = None
         self._setup_ui()
 
     def _setup_ui(self):
@@ -203,15 +205,21 @@ class PasswordPage(QWizardPage):
         pwd = self.password_input.text()
         confirm = self.confirm_input.text()
 
+        # Unchanged since the last successful check (e.g. Back then Next)
+        key = (pwd, confirm)
+        if key == self._last_validated:
+            return True
+
         if len(pwd) < 4:
             self.status_label.setText("Password must be at least 4 characters")
             return False
 
-        if pwd != confirm:
+        if not hmac.compare_digest(pwd.encode("utf-8"), confirm.encode("utf-8")):
             self.status_label.setText("Passwords do not match")
             return False
 
         self.status_label.setText("")
+        self._last_validated = key
         return True
 
 
@@ -380,13 +388,19 @@ class ModelPage(QWizardPage):
         if not start_dir.exists():
             start_dir = self.base_dir
 
-        # Use Qt dialog instead of native dialog to avoid macOS freeze
+        # The Qt-drawn dialog is only needed to avoid a native dialog
+        # freeze on macOS; elsewhere the native dialog opens faster
+        if sys.platform == "darwin":
+            options = QFileDialog.Option.DontUseNativeDialog
+        else:
+            options = QFileDialog.Option(0)
+
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select YOLO Model",
             str(start_dir),
             "PyTorch Models (*.pt);;ONNX Models (*.onnx);;All Files (*)",
-            options=QFileDialog.Option.DontUseNativeDialog,
+            options=options,
         )
 
         if file_path:
@@ -526,26 +540,22 @@ class CompletePage(QWizardPage):
 
     def _save_all_settings(self, wizard):
         """Save all wizard settings to files."""
-        base_dir = get_base_dir()
+        base_dir = wizard.base_dir
         env_path = base_dir / ".env"
         config_path = base_dir / "config.yaml"
 
-        # Create .env if not exists
-        if not env_path.exists():
-            env_path.touch()
-
-        # Save to .env
-        env_file = str(env_path)
+        # Collect .env updates; the file is written once below
+        env_updates = {}
 
         # Admin password
         admin_pwd = wizard.field("admin_password")
         if admin_pwd:
-            set_key(env_file, "ADMIN_PASSWORD", admin_pwd)
+            env_updates["ADMIN_PASSWORD"] = admin_pwd
 
         # Camera URL
         rtsp_url = wizard.field("rtsp_url")
         if rtsp_url:
-            set_key(env_file, "RTSP_URL", rtsp_url)
+            env_updates["RTSP_URL"] = rtsp_url
 
         # Email settings
         if wizard.field("email_enabled"):
@@ -554,20 +564,19 @@ class CompletePage(QWizardPage):
             recipient = wizard.field("recipient_email")
 
             if smtp_user:
-                set_key(env_file, "SMTP_USER", smtp_user)
+                env_updates["SMTP_USER"] = smtp_user
             if smtp_pwd:
-                set_key(env_file, "SMTP_PASSWORD", smtp_pwd)
+                env_updates["SMTP_PASSWORD"] = smtp_pwd
             if recipient:
-                set_key(env_file, "RECIPIENT_EMAIL", recipient)
+                env_updates["RECIPIENT_EMAIL"] = recipient
 
-            set_key(env_file, "SMTP_HOST", "smtp.gmail.com")
-            set_key(env_file, "SMTP_PORT", "587")
+            env_updates["SMTP_HOST"] = "smtp.gmail.com"
+            env_updates["SMTP_PORT"] = "587"
 
         # Save to config.yaml
         config_data = {}
         if config_path.exists():
-            with open(config_path, "r") as f:
-                config_data = yaml.safe_load(f) or {}
+            config_data = load_yaml(config_path)
 
         # Update detection settings
         if "detection" not in config_data:
@@ -578,12 +587,8 @@ class CompletePage(QWizardPage):
             config_data["detection"]["model_path"] = model_path
 
         # Get confidence from ModelPage
-        for i in range(wizard.pageIds().__len__()):
-            page = wizard.page(wizard.pageIds()[i])
-            if isinstance(page, ModelPage):
-                conf = page.conf_spin.value() / 100.0
-                config_data["detection"]["confidence_threshold"] = conf
-                break
+        conf = wizard.model_page.conf_spin.value() / 100.0
+        config_data["detection"]["confidence_threshold"] = conf
 
         config_data["detection"]["target_class"] = 1  # Mounting
 
@@ -599,40 +604,48 @@ class CompletePage(QWizardPage):
         config_data["storage"]["db_path"] = "data/detections.db"
 
         # Write config
-        with open(config_path, "w") as f:
-            yaml.dump(config_data, f, default_flow_style=False, sort_keys=False)
+        save_yaml(config_path, config_data)
 
-        # Mark setup as complete
-        set_key(env_file, "SETUP_COMPLETE", "true")
+        # Save to .env (single rewrite), marking setup as complete
+        env_updates["SETUP_COMPLETE"] = "true"
+        update_env_file(env_path, env_updates)
+        is_first_run.cache_clear()
 
         # Save camera to database
-        rtsp_url = wizard.field("rtsp_url")
         if rtsp_url:
+            from src.database import Database
+
             db = Database()
             # Check if camera already exists to avoid duplicates
-            existing_cameras = db.get_cameras()
-            if not any(c[2] == rtsp_url for c in existing_cameras):
+            if not db.camera_exists(rtsp_url):
                 db.add_camera("Main Camera", rtsp_url, "Configured via Setup Wizard")
 
 
+@functools.lru_cache(maxsize=1)
 def is_first_run() -> bool:
-    """Check if this is the first run of the application."""
+    """
+    Check if this is the first run of the application.
+
+    The result is cached for the process; completing the wizard clears it.
+    """
     base_dir = get_base_dir()
     env_path = base_dir / ".env"
 
     if not env_path.exists():
         return True
 
-    # Check for SETUP_COMPLETE flag
-    from dotenv import load_dotenv
+    # Check for SETUP_COMPLETE flag; the process environment takes
+    # precedence (as with load_dotenv), otherwise read the file directly
+    setup_complete = os.getenv("SETUP_COMPLETE")
+    if setup_complete is None:
+        from dotenv import dotenv_values
 
-    load_dotenv(env_path)
-    return os.getenv("SETUP_COMPLETE") != "true"
+        setup_complete = dotenv_values(env_path).get("SETUP_COMPLETE")
+    return setup_complete != "true"
 
 
 # For testing
 if __name__ == "__main__":
-    import sys
     from PyQt6.QtWidgets import QApplication
 
     app = QApplication(sys.argv)
@@ -3,7 +3,7 @@ import os
 import time
 import logging
 from typing import Optional
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QImage
 from src.detector import Detector
 from src.notification_scheduler import NotificationScheduler
@@ -11,6 +11,23 @@ from src.notification_scheduler import NotificationScheduler
 # Logger settings
 logger = logging.getLogger("SwineMonitor.Video")
 
+# Frames emitted but not yet shown before new frames are dropped
+MAX_PENDING_FRAMES = 2
+
+# Pixel stride of the sample used to spot repeated frames
+DUPLICATE_SAMPLE_STRIDE = 16
+
+# Upper bound on a blocking open/read, so stop() never waits out a
+# 30 s FFmpeg network timeout (properties exist in OpenCV >= 4.6)
+CAPTURE_TIMEOUT_MS = 5000
+if hasattr(cv2, "CAP_PROP_READ_TIMEOUT_MSEC"):
+    CAPTURE_PARAMS = [
+        cv2.CAP_PROP_OPEN_TIMEOUT_MSEC, CAPTURE_TIMEOUT_MS,
+        cv2.CAP_PROP_READ_TIMEOUT_MSEC, CAPTURE_TIMEOUT_MS,
+    ]
+else:
+    CAPTURE_PARAMS = []
+
 
 class VideoThread(QThread):
     change_pixmap_signal = pyqtSignal(QImage)
@@ -28,47 +45,96 @@ class VideoThread(QThread):
         self.scheduler = scheduler
         self._run_flag = True
 
+        # Backpressure: each counter is written by one thread only
+        self._frames_emitted = 0  # worker thread
+        self._frames_shown = 0  # GUI thread (see _on_frame_delivered)
+
+        # Size of the display label; frames are scaled here, off the GUI thread
+        self._display_size: Optional[tuple[int, int]] = None
+        # Queued to the GUI thread, which owns this QThread object
+        self.change_pixmap_signal.connect(self._on_frame_delivered)
+
         # From UDP to TCP for error of decode et, al.
         os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = "rtsp_transport;tcp"
 
-        # Initialize Detector with scheduler
+        # Resolve the video source once: a digit string is a local camera
+        # index; anything else is a URL/file opened directly with FFmpeg
+        # (skipping backend autodetection on every reconnect)
+        if str(rtsp_url).isdigit():
+            self._source = int(rtsp_url)
+            self._capture_api = cv2.CAP_ANY
+        else:
+            self._source = rtsp_url
+            self._capture_api = cv2.CAP_FFMPEG
+
+        # Initialize Detector with scheduler.
+        # Created once per thread: loading the YOLO model takes seconds, so
+        # the reconnect loop in run() must reuse it rather than rebuild it.
         self.detector = Detector(barn_id=self.barn_id, scheduler=self.scheduler)
 
     def run(self):  # This function is called when the window thread is opened
+        process_frame = self.detector.process_frame
+        # OpenCV frames are BGR; Qt reads that layout directly (no cvtColor)
+        bgr_format = QImage.Format.Format_BGR888
+
+        # Sampled pixels and result of the last inferred frame; static
+        # scenes (and streams that repeat frames) skip the model
+        last_sample = None
+        last_result = None
+
         while self._run_flag:
             self.status_signal.emit("Connecting to source...")
 
-            # Prepare video source
-            source = self.rtsp_url
-            if str(source).isdigit():
-                source = int(source)
-
             # Try to connect
-            cap = cv2.VideoCapture(source)
+            if CAPTURE_PARAMS:
+                cap = cv2.VideoCapture(self._source, self._capture_api, CAPTURE_PARAMS)
+            else:
+                cap = cv2.VideoCapture(self._source, self._capture_api)
 
             if not cap.isOpened():
+                cap.release()
                 self.status_signal.emit("Connection Failed. Retrying in 3 seconds...")
-                time.sleep(3)
+                self._sleep_while_running(3000)
                 continue
 
             # Log
             self.status_signal.emit("Monitoring Active")
             logger.info(f"Monitoring Active; Barn ID: {self.barn_id}")
 
-            # To detect video freeze (For watchdog)
-            last_frame_time = time.time()
-
             while self._run_flag:
                 try:
-                    ret, frame = cap.read()
-                    if ret:
-                        # Get last time when to read frame successfully
-                        last_frame_time = time.time()
-
-                        # Inference & Annotate
-                        annotated_frame, detected, conf, class_name = (
-                            self.detector.process_frame(frame)
-                        )
+                    # Time only the capture call (watchdog), so slow inference
+                    # on the previous frame never counts as a freeze;
+                    # monotonic so clock adjustments cannot trigger or mask it
+                    read_start = time.monotonic()
+                    # GUI is behind: grab without decoding and drop the frame
+                    if self._frames_emitted - self._frames_shown >= MAX_PENDING_FRAMES:
+                        ret, frame = cap.grab(), None
+                    else:
+                        ret, frame = cap.read()
+                    read_time = time.monotonic() - read_start
+
+                    if not ret:
+                        logger.warning("Stream Lost")
+                        self.status_signal.emit("Stream Lost")
+                        break
+
+                    # Check for video freeze (Watchdog): the source took too
+                    # long to deliver this frame
+                    if read_time > 5.0:
+                        logger.warning("Video freeze detected")
+                        self.status_signal.emit("Video freeze detected")
+                        break
+
+                    if frame is not None:
+                        # Inference & Annotate (reused for an identical frame)
+                        sample = frame[
+                            ::DUPLICATE_SAMPLE_STRIDE, ::DUPLICATE_SAMPLE_STRIDE
+                        ].tobytes()
+                        if sample != last_sample:
+                            last_result = process_frame(frame)
+                            last_sample = sample
+                        annotated_frame, detected, conf, class_name = last_result
 
                         if detected:
                             self.status_signal.emit(
@@ -76,37 +142,35 @@ class VideoThread(QThread):
                             )
 
                         # Draw
-                        rgb_image = cv2.cvtColor(annotated_frame, cv2.COLOR_BGR2RGB)
-                        h, w, ch = rgb_image.shape
+                        h, w, ch = annotated_frame.shape
                         bytes_per_line = ch * w
 
                         # Create QImage matching the numpy array
                         qt_image = QImage(
-                            rgb_image.data,
+                            annotated_frame.data,
                             w,
                             h,
                             bytes_per_line,
-                            QImage.Format.Format_RGB888,
+                            bgr_format,
                         )
                         # CRITICAL: QImage(data, ...) creates a view, not a copy.
-                        # We MUST copy() it because rgb_image will be destroyed
-                        # at the end of this iteration, while the Main Thread
+                        # We MUST detach it because annotated_frame will be
+                        # replaced on the next iteration, while the Main Thread
                         # processes the emitted signal asynchronously.
-                        qt_image = qt_image.copy()
+                        # Scaling to the display size produces a new buffer,
+                        # so it doubles as that copy.
+                        display_size = self._display_size
+                        if display_size:
+                            qt_image = qt_image.scaled(
+                                *display_size,
+                                Qt.AspectRatioMode.KeepAspectRatio,
+                            )
+                        else:
+                            qt_image = qt_image.copy()
 
+                        self._frames_emitted += 1
                         self.change_pixmap_signal.emit(qt_image)
 
-                    else:
-                        logger.warning("Stream Lost")
-                        self.status_signal.emit("Stream Lost")
-                        break
-
-                    # Check for video freeze (Watchdog)
-                    if time.time() - last_frame_time > 5.0:
-                        logger.warning("Video freeze detected")
-                        self.status_signal.emit("Video freeze detected")
-                        break
-
                 except Exception as e:
                     logger.error(f"Error in video thread: {e}")
                     print(f"Error in video thread: {e}")
@@ -117,10 +181,24 @@ class VideoThread(QThread):
             if self._run_flag:
                 self.status_signal.emit("Reconnecting...")
                 logger.info("Attempting to reconnect in 2s")
-                time.sleep(2)
+                self._sleep_while_running(2000)
 
         self.status_signal.emit("Stopped")
 
+    def set_display_size(self, width: int, height: int) -> None:
+        """Set the size emitted frames are scaled to (keeping aspect ratio)."""
+        self._display_size = (width, height)
+
+    def _sleep_while_running(self, msecs: int) -> None:
+        """Back off for up to msecs, returning early once stop() is called."""
+        deadline = time.monotonic() + msecs / 1000.0
+        while self._run_flag and time.monotonic() < deadline:
+            self.msleep(100)
+
+    def _on_frame_delivered(self, _qt_image):
+        """Count a frame as delivered once the GUI event loop reaches it."""
+        self._frames_shown += 1
+
     def stop(self):  # Botton to stop the video stream
         self._run_flag = False
         self.wait()
@@ -4,12 +4,164 @@ Logger Configuration
 ====================
 
 Configures application-wide logging with file rotation and console output.
+Records are handed to a background QueueListener, so logging callers never
+block on console or disk I/O.
 """
 
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Optional
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that batches writes in a large user-space buffer.
+    
+    The standard handler flushes after every record, costing one write()
+    syscall per log line. This handler marks the buffer dirty instead, and
+    a single long-lived daemon thread per handler writes it out every
+    ``flush_interval`` seconds. WARNING and above, rollover and close are
+    flushed immediately.
+    
+    Note:
+        If the process is killed, up to ``flush_interval`` seconds of
+        INFO/DEBUG records may be lost.
+    
+    Examples:
+        >>> handler = BufferedRotatingFileHandler("logs/app.log", maxBytes=1024)
+    """
+    
+    def __init__(self, *args, buffer_size: int = 64 * 1024, flush_interval: float = 1.0, **kwargs):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._dirty = False
+        self._stop_flusher = threading.Event()
+        super().__init__(*args, **kwargs)
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name="LogFileFlusher", daemon=True
+        )
+        self._flusher.start()
+    
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        if record.levelno >= logging.WARNING:
+            self.flush_now()
+    
+    def flush(self) -> None:
+        """Called after each record; the flusher thread writes it out later."""
+        self._dirty = True
+    
+    def _flush_loop(self) -> None:
+        """Write pending output every ``flush_interval`` until closed."""
+        while not self._stop_flusher.wait(self.flush_interval):
+            if self._dirty:
+                self.flush_now()
+    
+    def flush_now(self) -> None:
+        """Write buffered records to disk immediately."""
+        self.acquire()
+        try:
+            self._dirty = False
+            super().flush()
+        finally:
+            self.release()
+    
+    def close(self) -> None:
+        self._stop_flusher.set()
+        self.flush_now()
+        super().close()
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that reuses the rendered timestamp within the same second.
+    
+    With a seconds-resolution ``datefmt`` every record logged in one second
+    shares the same ``asctime``, so strftime only runs once per second.
+    
+    Examples:
+        >>> formatter = CachedTimeFormatter("{asctime} {message}", style="{")
+    """
+    
+    # Millisecond suffix is not part of the configured format
+    default_msec_format = None
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (second, text) stored as one tuple so readers never see a torn pair
+        self._time_cache: tuple[int, str] = (-1, "")
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        cached_second, cached_text = self._time_cache
+        if second == cached_second:
+            return cached_text
+        text = super().formatTime(record, datefmt)
+        self._time_cache = (second, text)
+        return text
+
+
+class _FlushingQueueListener(QueueListener):
+    """
+    QueueListener that tracks whether it is running and whose stop() also
+    pushes buffered file output to disk.
+    
+    start() and stop() are safe to call in any order and more than once
+    (QueueListener.stop() is not idempotent before Python 3.12).
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.running = False
+    
+    def start(self) -> None:
+        if not self.running:
+            super().start()
+            self.running = True
+    
+    def stop(self) -> None:
+        if not self.running:
+            return
+        self.running = False
+        super().stop()
+        for handler in self.handlers:
+            # At interpreter exit a stream may already be closed; ignore it
+            # the same way logging.shutdown() does
+            try:
+                getattr(handler, "flush_now", handler.flush)()
+            except (OSError, ValueError):
+                pass
+
+
+# Started listeners by logger name (see setup_logger / enable_queue_logging)
+_listeners: dict[str, _FlushingQueueListener] = {}
+
+
+def _attach_queue(logger: logging.Logger, handlers: list[logging.Handler]) -> _FlushingQueueListener:
+    """Route ``logger`` through a queue drained by ``handlers`` on a thread."""
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    
+    listener = _FlushingQueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners[logger.name] = listener
+    # Flush whatever is still queued when the interpreter exits
+    atexit.register(listener.stop)
+    return listener
 
 
 def setup_logger(
@@ -17,14 +169,18 @@ def setup_logger(
     log_path: str = "logs/system.log",
     level: int = logging.INFO,
     max_bytes: int = 5 * 1024 * 1024,
-    backup_count: int = 3
+    backup_count: int = 3,
+    use_queue: bool = True
 ) -> logging.Logger:
     """
     Set up and configure a logger with file and console handlers.
     
     Creates a logger that writes to both a rotating log file and the console.
-    If the logger already has handlers configured, returns the existing logger
-    without modification to avoid duplicate handlers.
+    By default the handlers run on a background QueueListener thread and the
+    logger itself only holds a QueueHandler, so ``logger.info()`` is an
+    in-memory enqueue for the caller. If the logger already has handlers
+    configured, returns the existing logger without modification to avoid
+    duplicate handlers.
     
     Args:
         name: The name of the logger. Default is "SwineMonitor".
@@ -35,6 +191,8 @@ def setup_logger(
         max_bytes: Maximum size of each log file before rotation.
                    Default is 5MB.
         backup_count: Number of backup files to keep. Default is 3.
+        use_queue: Write through a QueueHandler/QueueListener pair.
+                   Default is True.
     
     Returns:
         logging.Logger: Configured logger instance.
@@ -51,27 +209,72 @@ def setup_logger(
         return logger
 
     # Create formatter
-    formatter = logging.Formatter(
-        "%(asctime)s - %(levelname)s - %(module)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
+    formatter = CachedTimeFormatter(
+        "{asctime} - {levelname} - {module} - {message}",
+        datefmt="%Y-%m-%d %H:%M:%S",
+        style="{"
     )
 
     # File handler with rotation
     log_file = Path(log_path)
     log_file.parent.mkdir(parents=True, exist_ok=True)
 
-    file_handler = RotatingFileHandler(
+    file_handler = BufferedRotatingFileHandler(
         log_file,
         maxBytes=max_bytes,
         backupCount=backup_count,
         encoding="utf-8"
     )
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+
+    if use_queue:
+        _attach_queue(logger, [file_handler, console_handler])
+    else:
+        logger.addHandler(file_handler)
+        logger.addHandler(console_handler)
 
     return logger
+
+
+def enable_queue_logging(name: str = "SwineMonitor") -> QueueListener:
+    """
+    Move a logger's handlers behind a QueueHandler/QueueListener pair.
+
+    The existing handlers (file, console) are detached from the logger and
+    driven by a background QueueListener thread instead, so callers on the
+    GUI thread only pay for an in-memory enqueue rather than blocking on
+    console or disk I/O. A logger that is already queued is left as is and
+    its listener (restarted if it was stopped) is returned. A logger with
+    no handlers yet is configured by ``setup_logger(name)``, which queues
+    by default.
+
+    Args:
+        name: The name of the logger to convert. Default is "SwineMonitor".
+
+    Returns:
+        QueueListener: The started listener. Call ``stop()`` on shutdown
+        to flush pending records.
+
+    Examples:
+        >>> listener = enable_queue_logging()
+        >>> ...
+        >>> listener.stop()
+    """
+    logger = logging.getLogger(name)
+    listener = _listeners.get(name)
+    if listener is not None:
+        listener.start()  # No-op unless stopped earlier; resume draining
+        return listener
+
+    if not logger.handlers:
+        setup_logger(name)
+        return _listeners[name]
+
+    handlers = [h for h in logger.handlers if not isinstance(h, QueueHandler)]
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+    return _attach_queue(logger, handlers)
@@ -5,27 +5,93 @@ Provides notification capabilities via:
 - Discord (Webhook) - Original implementation
 - Email (SMTP/Gmail) - New implementation
 
-Both notifiers use async (threaded) sending to avoid blocking the main thread.
+Both notifiers use async sending on a shared worker pool to avoid blocking
+the main thread.
 """
 
 import requests
+import io
 import os
+import atexit
+import random
 import logging
-import threading
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from datetime import datetime
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 
-# Load environment variables from .env
-load_dotenv()
+# Load environment variables from .env (callers that already loaded it,
+# or manage the environment themselves, can set NOTIFIER_SKIP_DOTENV).
+# The marker is inherited by child processes, which already have the
+# parent's environment and need not parse the file again.
+if os.getenv("NOTIFIER_SKIP_DOTENV") is None and not os.getenv("_DOTENV_LOADED"):
+    from dotenv import load_dotenv
+    load_dotenv()
+    os.environ["_DOTENV_LOADED"] = "1"
 
 # Logger
 logger = logging.getLogger("SwineMonitor.Notifier")
 
+# Email report separators
+_RULE_HEAVY = "=" * 40
+_RULE_LIGHT = "-" * 40
+_REPORT_FOOTER = (
+    f"{_RULE_LIGHT}\n"
+    "\n"
+    "This is an automated message from Swine Monitor System.\n"
+    "Do not reply to this email."
+)
+
+# Connection-level SMTP failures worth retrying on a fresh connection
+_SMTP_TRANSIENT_ERRORS = (
+    smtplib.SMTPServerDisconnected,
+    smtplib.SMTPConnectError,
+    ConnectionError,
+    TimeoutError,
+)
+
+# Last rendered "now" timestamp as (epoch second, text)
+_now_cache: tuple[int, str] = (-1, "")
+
+
+def _now_str() -> str:
+    """
+    Return the current local time as "YYYY-MM-DD HH:MM:SS".
+    
+    The text only changes once per second, so it is rendered once and
+    reused for every call within the same second.
+    """
+    global _now_cache
+    now = int(time.time())
+    cached_second, cached_text = _now_cache
+    if now == cached_second:
+        return cached_text
+    text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+    _now_cache = (now, text)
+    return text
+
+
+# Shared, bounded pool for outgoing notifications. Worker threads are reused
+# across sends, so a burst of detections cannot spawn unbounded threads.
+_NOTIFY_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="Notifier")
+atexit.register(_NOTIFY_POOL.shutdown, wait=False)
+
+# Email notifiers holding batched detections; flushed at interpreter exit
+_BATCHING_NOTIFIERS: "weakref.WeakSet[EmailNotifier]" = weakref.WeakSet()
+
+
+def _flush_pending_emails() -> None:
+    """Send any batched detections that have not been flushed yet."""
+    for notifier in list(_BATCHING_NOTIFIERS):
+        notifier.flush()
+
+
+atexit.register(_flush_pending_emails)
+
 
 # =============================================================================
 # Discord Notifier (Original - Kept for backward compatibility)
@@ -34,49 +100,157 @@ logger = logging.getLogger("SwineMonitor.Notifier")
 class DiscordNotifier:
     """Send notifications to Discord via Webhook."""
     
-    def __init__(self, webhook_url: Optional[str] = None):
+    # Images larger than this (or any PNG) are re-encoded before upload
+    COMPRESS_THRESHOLD_BYTES = 512 * 1024
+    
+    def __init__(
+        self,
+        webhook_url: Optional[str] = None,
+        resize_max_dim: int = 1280,
+        jpeg_quality: int = 85,
+    ):
         self.webhook_url = webhook_url
         self.enabled = bool(webhook_url)
+        self.resize_max_dim = resize_max_dim
+        self.jpeg_quality = jpeg_quality
+        
+        # Keep-alive session so consecutive sends reuse the TCP/TLS connection.
+        # Rate limits (429, honouring Retry-After) and server errors are
+        # retried inside urllib3 with exponential backoff; the final
+        # response is still returned and checked in _send_sync.
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["POST"],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry),
+        )
 
     def send(self, message: str, image_path: Optional[str] = None):
         """
         Send a message and optional image to Discord via Webhook.
-        Non-blocking (async via thread).
+        Non-blocking (async via the notification pool).
         """
         if not self.webhook_url:
             logger.warning("No Discord webhook URL provided, skipping notification.")
             return
 
-        thread = threading.Thread(
-            target=self._send_sync,
-            args=(message, image_path),
-            daemon=True,
-        )
-        thread.start()
+        _NOTIFY_POOL.submit(self._send_sync, message, image_path)
 
     def _send_sync(self, message: str, image_path: Optional[str] = None):
-        """Synchronous send (called in thread)."""
+        """Synchronous send (called on a pool worker)."""
         payload = {"content": message}
 
         try:
-            if image_path and os.path.exists(image_path):
-                with open(image_path, "rb") as f:
-                    files = {"file": (os.path.basename(image_path), f.read())}
-                response = requests.post(
+            # Large images and PNGs are re-encoded; anything else is read
+            # as is and closed before posting, so retries do not hold the
+            # file open. A missing file falls back to text only.
+            files = None
+            if image_path:
+                is_png = image_path.lower().endswith(".png")
+                compressed = self._compress_image(image_path, is_png)
+                if compressed is not None:
+                    files = {"file": ("detection.jpg", compressed, "image/jpeg")}
+                else:
+                    try:
+                        with open(image_path, "rb") as f:
+                            image_data = f.read()
+                    except FileNotFoundError:
+                        pass
+                    else:
+                        fname = os.path.basename(image_path)
+                        mime = "image/png" if is_png else "image/jpeg"
+                        files = {"file": (fname, image_data, mime)}
+
+            if files is not None:
+                response = self._session.post(
                     self.webhook_url, data=payload, files=files, timeout=30
                 )
             else:
-                response = requests.post(self.webhook_url, json=payload, timeout=30)
+                response = self._session.post(self.webhook_url, json=payload, timeout=30)
 
-            if response.status_code in [200, 204]:
-                logger.info("Discord notification sent successfully.")
-            else:
+            response.raise_for_status()
+            logger.info("Discord notification sent successfully.")
+
+        except requests.HTTPError as e:
+            if logger.isEnabledFor(logging.ERROR):
+                # response.text decodes the whole body; only pay for it if logged
                 logger.error(
-                    f"Discord notification failed: {response.status_code}, {response.text}"
+                    "Discord notification failed: %s, %s",
+                    e.response.status_code,
+                    e.response.text,
+                )
+        except Exception as e:
+            logger.error("Error sending Discord notification: %s", e)
+
+    def send_text(self, message: str, timeout: float = 10):
+        """
+        Post a text message synchronously over the pooled session.
+
+        Unlike send(), this blocks and raises on failure, so callers such
+        as the settings test button can report the outcome.
+
+        Args:
+            message: Message content
+            timeout: Request timeout in seconds
+
+        Raises:
+            requests.HTTPError: If Discord rejects the message
+            requests.RequestException: If the request fails
+        """
+        response = self._session.post(self.webhook_url, json={"content": message}, timeout=timeout)
+        response.raise_for_status()
+
+    def _compress_image(self, image_path: str, is_png: bool) -> Optional[bytes]:
+        """
+        Re-encode a large or PNG image as a downscaled JPEG for upload.
+
+        Args:
+            image_path: Path to the image on disk
+            is_png: Whether the image is a PNG (always re-encoded)
+
+        Returns:
+            JPEG bytes, or None to upload the original file unchanged
+        """
+        if not is_png:
+            try:
+                if os.path.getsize(image_path) <= self.COMPRESS_THRESHOLD_BYTES:
+                    return None
+            except OSError:
+                return None
+
+        try:
+            import cv2  # Deferred: only needed for oversized images
+
+            image = cv2.imread(image_path)
+            if image is None:
+                return None
+
+            height, width = image.shape[:2]
+            scale = self.resize_max_dim / max(height, width)
+            if scale < 1:
+                image = cv2.resize(
+                    image,
+                    (round(width * scale), round(height * scale)),
+                    interpolation=cv2.INTER_AREA,
                 )
 
+            ok, encoded = cv2.imencode(
+                ".jpg",
+                image,
+                [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality, cv2.IMWRITE_JPEG_OPTIMIZE, 1],
+            )
         except Exception as e:
-            logger.error(f"Error sending Discord notification: {e}")
+            logger.debug("Image compression skipped for %s: %s", image_path, e)
+            return None
+
+        return encoded.tobytes() if ok else None
 
 
 # Alias for backward compatibility
@@ -90,6 +264,15 @@ Notifier = DiscordNotifier
 class EmailNotifier:
     """Send notifications via Email (SMTP)."""
     
+    # Seconds after which a pooled connection is assumed closed by the server
+    SMTP_IDLE_TIMEOUT = 240.0
+    # Connect/login timeout, and socket timeout once authenticated
+    SMTP_CONNECT_TIMEOUT = 10
+    SMTP_SEND_TIMEOUT = 30
+    # Attempts for transient connection failures, with jittered backoff
+    SMTP_RETRIES = 3
+    SMTP_BACKOFF = 0.5
+    
     def __init__(
         self,
         smtp_host: str = "smtp.gmail.com",
@@ -98,6 +281,7 @@ class EmailNotifier:
         smtp_password: str = "",
         recipient_email: str = "",
         enabled: bool = True,
+        flush_interval: float = 10.0,
     ):
         """
         Initialize Email Notifier.
@@ -109,6 +293,8 @@ class EmailNotifier:
             smtp_password: SMTP password (decrypted)
             recipient_email: Email address to send notifications to
             enabled: Whether email notifications are enabled
+            flush_interval: Seconds send_single() collects detections
+                            before sending them as one email
         """
         self.smtp_host = smtp_host
         self.smtp_port = smtp_port
@@ -116,6 +302,17 @@ class EmailNotifier:
         self.smtp_password = smtp_password
         self.recipient_email = recipient_email
         self.enabled = enabled and bool(smtp_user and smtp_password and recipient_email)
+        
+        # Authenticated connection reused across sends (see _get_connection)
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_lock = threading.Lock()
+        self._smtp_last_used = 0.0
+        
+        # Detections batched by send_single (see flush)
+        self.flush_interval = flush_interval
+        self._pending: List[Dict] = []
+        self._pending_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
     
     @classmethod
     def from_config(cls, config: dict) -> "EmailNotifier":
@@ -123,15 +320,18 @@ class EmailNotifier:
         Create EmailNotifier from configuration dictionary.
         
         Args:
-            config: Dictionary with email settings
+            config: Dictionary with email settings. The password is taken
+                    from ``smtp_password`` (plain, e.g. from the environment)
+                    or else decrypted from ``smtp_password_encrypted``.
             
         Returns:
             EmailNotifier instance
         """
-        from .encryption import decrypt_password
-        
+        password = config.get("smtp_password", "")
         encrypted_password = config.get("smtp_password_encrypted", "")
-        password = decrypt_password(encrypted_password) if encrypted_password else ""
+        if not password and encrypted_password:
+            from .encryption import decrypt_password
+            password = decrypt_password(encrypted_password)
         
         return cls(
             smtp_host=config.get("smtp_host", "smtp.gmail.com"),
@@ -145,7 +345,7 @@ class EmailNotifier:
     def send(self, subject: str, detections: List[Dict]):
         """
         Send email notification with detection list.
-        Non-blocking (async via thread).
+        Non-blocking (async via the notification pool).
         
         Args:
             subject: Email subject
@@ -160,25 +360,28 @@ class EmailNotifier:
             logger.warning("No detections to send, skipping email.")
             return
 
-        thread = threading.Thread(
-            target=self._send_sync,
-            args=(subject, detections),
-            daemon=True,
-        )
-        thread.start()
+        _NOTIFY_POOL.submit(self._send_sync, subject, detections)
     
     def send_single(self, barn_id: str, confidence: float, timestamp: Optional[str] = None, class_name: str = "Unknown"):
         """
         Convenience method to send a single detection notification.
         
+        Detections are batched: the first one starts a ``flush_interval``
+        timer and everything queued until it fires goes out in one email.
+        
         Args:
             barn_id: The barn identifier
             confidence: Detection confidence score
             timestamp: Detection timestamp (uses current time if None)
             class_name: Name of the detected class
         """
+        # Checked before any formatting so disabled notifiers cost nothing
+        if not self.enabled:
+            logger.warning("Email notifications disabled, skipping.")
+            return
+        
         if timestamp is None:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            timestamp = _now_str()
         
         detection = {
             "barn_id": barn_id,
@@ -187,35 +390,171 @@ class EmailNotifier:
             "class_name": class_name,
         }
         
-        self.send(
-            subject="[Swine Monitor] Mating Behavior Detected",
-            detections=[detection]
-        )
+        with self._pending_lock:
+            self._pending.append(detection)
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+                _BATCHING_NOTIFIERS.add(self)
+    
+    def flush(self):
+        """Send batched send_single() detections now, as a single email."""
+        with self._pending_lock:
+            batch, self._pending = self._pending, []
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        
+        if not batch:
+            return
+        
+        if len(batch) == 1:
+            subject = "[Swine Monitor] Mating Behavior Detected"
+        else:
+            subject = f"[Swine Monitor] {len(batch)} Detections"
+        self._send_sync(subject, batch)
     
     def _send_sync(self, subject: str, detections: List[Dict]):
-        """Synchronous send (called in thread)."""
+        """Synchronous send (called on a pool worker)."""
         try:
-            body = self._format_detection_list(detections)
-            
-            msg = MIMEMultipart()
-            msg["From"] = self.smtp_user
-            msg["To"] = self.recipient_email
-            msg["Subject"] = subject
-            msg.attach(MIMEText(body, "plain", "utf-8"))
-            
-            with smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=30) as server:
-                server.starttls()
-                server.login(self.smtp_user, self.smtp_password)
-                server.send_message(msg)
-            
-            logger.info(f"Email notification sent to {self.recipient_email}")
+            self.send_text(subject, self._format_detection_list(detections))
+            logger.info("Email notification sent to %s", self.recipient_email)
             
         except smtplib.SMTPAuthenticationError as e:
-            logger.error(f"Email authentication failed: {e}")
+            logger.error("Email authentication failed: %s", e)
         except smtplib.SMTPException as e:
-            logger.error(f"SMTP error: {e}")
+            logger.error("SMTP error: %s", e)
         except Exception as e:
-            logger.error(f"Error sending email notification: {e}")
+            logger.error("Error sending email notification: %s", e)
+    
+    def send_text(self, subject: str, body: str):
+        """
+        Send a plain-text email synchronously over the pooled connection.
+        
+        Unlike send(), this blocks and raises on failure, so callers that
+        compose their own messages (daily summary, test email) can report
+        errors while still sharing one authenticated SMTP session.
+        
+        Args:
+            subject: Email subject
+            body: Plain-text email body
+            
+        Raises:
+            smtplib.SMTPException: If authentication or delivery fails
+            OSError: If the server cannot be reached
+        """
+        # Serialize once; the reconnect retry in send_raw() reuses the bytes
+        self.send_raw(self.build_message(subject, body))
+    
+    def build_message(self, subject: str, body: str) -> bytes:
+        """
+        Serialize a plain-text email addressed from/to this notifier.
+        
+        Args:
+            subject: Email subject
+            body: Plain-text email body
+            
+        Returns:
+            The RFC 5322 message as bytes, ready for send_raw()
+        """
+        # Only needed when an email actually goes out
+        from email.message import EmailMessage
+        
+        # Single text/plain part, no multipart wrapper. Quoted-printable keeps
+        # the body 7-bit clean, since sendmail() does not negotiate 8BITMIME
+        msg = EmailMessage()
+        msg["From"] = self.smtp_user
+        msg["To"] = self.recipient_email
+        msg["Subject"] = subject
+        msg.set_content(body, charset="utf-8", cte="quoted-printable")
+        return msg.as_bytes()
+    
+    def send_raw(self, raw: bytes):
+        """
+        Send an already serialized message synchronously.
+        
+        Args:
+            raw: Message bytes, e.g. from build_message()
+            
+        Raises:
+            smtplib.SMTPException: If authentication or delivery fails
+            OSError: If the server cannot be reached
+        """
+        recipients = [self.recipient_email]
+        
+        with self._smtp_lock:
+            for attempt in range(self.SMTP_RETRIES):
+                try:
+                    self._get_connection().sendmail(self.smtp_user, recipients, raw)
+                    break
+                except _SMTP_TRANSIENT_ERRORS as e:
+                    self._close_connection()
+                    if attempt == self.SMTP_RETRIES - 1:
+                        raise
+                    # A stale pooled connection is retried at once; repeated
+                    # failures back off exponentially with jitter
+                    delay = 0 if attempt == 0 else self.SMTP_BACKOFF * 2 ** (attempt - 1)
+                    logger.warning("SMTP send failed (%s), retrying in %.1fs", e, delay)
+                    time.sleep(delay + random.uniform(0, 0.1))
+                except Exception:
+                    self._close_connection()
+                    raise
+            self._smtp_last_used = time.monotonic()
+    
+    def _get_connection(self) -> smtplib.SMTP:
+        """
+        Return an authenticated SMTP connection, reconnecting if needed.
+        
+        Opening the connection (TCP + STARTTLS + login) costs about as much
+        as sending the message, so it is kept open between sends and
+        checked with NOOP before reuse. A connection idle for longer than
+        ``SMTP_IDLE_TIMEOUT`` has almost certainly been dropped by the
+        server and is replaced without the NOOP round trip. Caller must
+        hold ``_smtp_lock``.
+        
+        Returns:
+            Connected and authenticated smtplib.SMTP instance
+        """
+        if self._smtp is not None:
+            if time.monotonic() - self._smtp_last_used > self.SMTP_IDLE_TIMEOUT:
+                self._close_connection()
+        
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._close_connection()
+        
+        server = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=self.SMTP_CONNECT_TIMEOUT)
+        try:
+            server.starttls()
+            server.login(self.smtp_user, self.smtp_password)
+            # Fail fast on an unreachable server, but give DATA more time
+            server.sock.settimeout(self.SMTP_SEND_TIMEOUT)
+        except Exception:
+            server.close()
+            raise
+        
+        self._smtp = server
+        return server
+    
+    def _close_connection(self):
+        """Drop the pooled SMTP connection, ignoring errors on a dead socket."""
+        server, self._smtp = self._smtp, None
+        if server is None:
+            return
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+    
+    def close(self):
+        """Close the pooled SMTP connection (safe to call more than once)."""
+        with self._smtp_lock:
+            self._close_connection()
     
     def _format_detection_list(self, detections: List[Dict]) -> str:
         """
@@ -227,37 +566,30 @@ class EmailNotifier:
         Returns:
             Formatted string for email body
         """
-        lines = [
-            "Mating Behavior Detection Report",
-            "=" * 40,
-            "",
-            f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            f"Total Detections: {len(detections)}",
-            "",
-            "-" * 40,
-            "",
-        ]
+        buf = io.StringIO()
+        buf.write(
+            "Mating Behavior Detection Report\n"
+            f"{_RULE_HEAVY}\n"
+            "\n"
+            f"Report Generated: {_now_str()}\n"
+            f"Total Detections: {len(detections)}\n"
+            "\n"
+            f"{_RULE_LIGHT}\n"
+            "\n"
+        )
         
+        # One write per detection instead of one list entry per line
         for i, d in enumerate(detections, 1):
-            barn_id = d.get("barn_id", "Unknown")
-            class_name = d.get("class_name", "Unknown")
-            timestamp = d.get("timestamp", "Unknown")
-            confidence = d.get("confidence", 0.0)
-            
-            lines.append(f"[{i}] Barn: {barn_id}")
-            lines.append(f"    Class: {class_name}")
-            lines.append(f"    Time: {timestamp}")
-            lines.append(f"    Confidence: {confidence:.1%}")
-            lines.append("")
-        
-        lines.extend([
-            "-" * 40,
-            "",
-            "This is an automated message from Swine Monitor System.",
-            "Do not reply to this email.",
-        ])
-        
-        return "\n".join(lines)
+            buf.write(
+                f"[{i}] Barn: {d.get('barn_id', 'Unknown')}\n"
+                f"    Class: {d.get('class_name', 'Unknown')}\n"
+                f"    Time: {d.get('timestamp', 'Unknown')}\n"
+                f"    Confidence: {d.get('confidence', 0.0):.1%}\n"
+                "\n"
+            )
+        
+        buf.write(_REPORT_FOOTER)
+        return buf.getvalue()
     
     def test_connection(self) -> tuple[bool, str]:
         """
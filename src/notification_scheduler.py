@@ -11,21 +11,83 @@ The system now supports combining immediate notifications with daily summaries,
 allowing users to get both real-time alerts and end-of-day reports.
 """
 
+import functools
 import logging
 import os
+import re
 import smtplib
 import threading
 import time as time_module
-from datetime import datetime, time
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from typing import Any, Callable, Dict, List, Optional
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, time, timedelta
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import requests
 
 from src.database import Database
 from src.notification import DiscordNotifier, EmailNotifier
 
 logger = logging.getLogger("SwineMonitor.Scheduler")
 
+# "HH:MM" (or "H:MM") on the 24-hour clock
+_TIME_RE = re.compile(r"^([01]?\d|2[0-3]):([0-5]\d)$")
+
+# Static email bodies; only the {ts} timestamp is filled in per send
+_RULE = "=" * 40
+_NO_DETECTION_BODY = (
+    "Swine Monitor - Daily Summary\n"
+    f"{_RULE}\n"
+    "\n"
+    "Report Generated: {ts}\n"
+    "\n"
+    "✅ No mating behavior was detected during the past 24 hours.\n"
+    "\n"
+    "This is a routine status report confirming that the monitoring system\n"
+    "is operating normally and no mating activity was observed.\n"
+    "\n"
+    f"{_RULE}\n"
+    "This is an automated message from Swine Monitor System.\n"
+)
+# Marker spliced out of the pre-serialized no-detection email. Plain ASCII
+# without "=", so quoted-printable encoding leaves it intact.
+_TS_PLACEHOLDER = "{TIMESTAMP}"
+_NO_DETECTION_SUBJECT = "[Swine Monitor] Daily Summary - No Detections"
+_TEST_EMAIL_BODY = (
+    "Swine Monitor - Test Email\n"
+    f"{_RULE}\n"
+    "\n"
+    "This is a test email to verify your notification settings.\n"
+    "\n"
+    "Sent at: {ts}\n"
+    "\n"
+    "If you received this email, your email notifications are working correctly!\n"
+    "\n"
+    f"{_RULE}\n"
+)
+
+
+def _discord_detection_list(detections: List[Dict], total: int, limit: int = 10) -> str:
+    """
+    Format up to ``limit`` detections as Discord bullet lines.
+    
+    Args:
+        detections: Detections to list (only the first ``limit`` are shown)
+        total: Total detection count, used for the "... and N more" line
+        limit: Maximum number of bullet lines
+        
+    Returns:
+        Newline-separated bullet list
+    """
+    body = "\n".join(
+        f"• {d.get('barn_id', '?')} [{d.get('class_name', '?')}]: "
+        f"{d.get('confidence', 0):.1%} @ {d.get('timestamp', '?')}"
+        for d in detections[:limit]
+    )
+    if total > limit:
+        body += f"\n... and {total - limit} more"
+    return body
+
 
 class NotificationScheduler:
     """
@@ -45,6 +107,9 @@ class NotificationScheduler:
         discord_enabled: Whether Discord notifications are enabled
     """
     
+    # Longest the scheduler thread sleeps before re-checking the clock
+    MAX_SLEEP = 3600.0
+    
     def __init__(
         self,
         email_notifier: Optional[EmailNotifier] = None,
@@ -63,26 +128,63 @@ class NotificationScheduler:
         self.discord = discord_notifier
         self.db = db
         
-        # Notification modes (can be combined)
+        # Notification modes (can be combined). The daily summary fields
+        # are properties that wake the scheduler thread when assigned.
         self.immediate_enabled: bool = True
-        self.daily_summary_enabled: bool = False
-        self.daily_summary_time: time = time(9, 0)  # Default 09:00
+        self._daily_summary_enabled: bool = False
+        self._daily_summary_time: time = time(9, 0)  # Default 09:00
         
         # Channel enabled flags
         self.email_enabled: bool = True
         self.discord_enabled: bool = False
         
-        # Today's detections (for daily summary)
-        self._today_detections: List[Dict] = []
+        # Today's detections (for daily summary). Capped so a busy day cannot
+        # grow memory without bound; evictions are counted in _dropped_today.
+        # The detection path appends without locking (see _queue_detection);
+        # _lock only serialises the consumers (summary, clear_pending).
+        self.daily_cap: int = 10000
+        self._today_detections: Deque[Dict] = deque(maxlen=self.daily_cap)
+        self._dropped_today: int = 0
         self._lock = threading.Lock()
         
-        # Background scheduler
+        # Burst coalescing for immediate notifications (see _dispatch_immediate)
+        self.debounce_seconds: float = 3.0
+        self.burst_max: int = 20
+        self._burst_buffer: List[Dict] = []
+        self._burst_timer: Optional[threading.Timer] = None
+        self._burst_lock = threading.Lock()
+        
+        # Background scheduler; _wake_event interrupts its sleep to re-plan
         self._scheduler_thread: Optional[threading.Thread] = None
         self._running: bool = False
+        self._wake_event = threading.Event()
+        
+        # (notifier, head, tail) of the serialized no-detection email
+        self._no_detection_template: Optional[Tuple[EmailNotifier, bytes, bytes]] = None
         
         # Callbacks
         self._on_notification_sent: Optional[Callable] = None
     
+    @property
+    def daily_summary_enabled(self) -> bool:
+        """Whether to send the daily summary; assigning re-plans the scheduler."""
+        return self._daily_summary_enabled
+    
+    @daily_summary_enabled.setter
+    def daily_summary_enabled(self, enabled: bool) -> None:
+        self._daily_summary_enabled = enabled
+        self._wake_event.set()
+    
+    @property
+    def daily_summary_time(self) -> time:
+        """Time of day the summary is sent; assigning re-plans the scheduler."""
+        return self._daily_summary_time
+    
+    @daily_summary_time.setter
+    def daily_summary_time(self, value: time) -> None:
+        self._daily_summary_time = value
+        self._wake_event.set()
+    
     @classmethod
     def from_config(cls, config: Dict[str, Any], db: Optional[Database] = None) -> "NotificationScheduler":
         """
@@ -123,13 +225,11 @@ class NotificationScheduler:
         return scheduler
     
     @staticmethod
+    @functools.lru_cache(maxsize=32)
     def _parse_time(time_str: str) -> time:
-        """Parse time string (HH:MM) to time object."""
-        try:
-            parts = time_str.split(":")
-            return time(int(parts[0]), int(parts[1]))
-        except (ValueError, IndexError):
-            return time(9, 0)
+        """Parse time string (HH:MM) to time object, defaulting to 09:00."""
+        m = _TIME_RE.match(time_str)
+        return time(int(m.group(1)), int(m.group(2))) if m else time(9, 0)
     
     def start(self) -> None:
         """Start the background scheduler thread."""
@@ -137,6 +237,7 @@ class NotificationScheduler:
             return
         
         self._running = True
+        self._wake_event.clear()
         self._scheduler_thread = threading.Thread(
             target=self._scheduler_loop,
             daemon=True,
@@ -150,29 +251,37 @@ class NotificationScheduler:
         if self.daily_summary_enabled:
             mode_desc.append(f"Daily@{self.daily_summary_time.strftime('%H:%M')}")
         
-        logger.info(f"Notification scheduler started (modes: {', '.join(mode_desc) or 'None'})")
+        logger.info("Notification scheduler started (modes: %s)", ", ".join(mode_desc) or "None")
     
     def stop(self) -> None:
         """Stop the background scheduler thread."""
         self._running = False
+        self._wake_event.set()
         if self._scheduler_thread:
             self._scheduler_thread.join(timeout=2)
+        
+        # Don't lose detections still waiting in the debounce window
+        with self._burst_lock:
+            if self._burst_timer is not None:
+                self._burst_timer.cancel()
+        self._flush_burst()
+        
         logger.info("Notification scheduler stopped")
     
     def set_immediate_enabled(self, enabled: bool) -> None:
         """Enable or disable immediate notifications."""
         self.immediate_enabled = enabled
-        logger.info(f"Immediate notifications: {'enabled' if enabled else 'disabled'}")
+        logger.info("Immediate notifications: %s", "enabled" if enabled else "disabled")
     
     def set_daily_summary_enabled(self, enabled: bool) -> None:
         """Enable or disable daily summary."""
         self.daily_summary_enabled = enabled
-        logger.info(f"Daily summary: {'enabled' if enabled else 'disabled'}")
+        logger.info("Daily summary: %s", "enabled" if enabled else "disabled")
     
     def set_daily_summary_time(self, hour: int, minute: int = 0) -> None:
         """Set the daily summary time."""
         self.daily_summary_time = time(hour, minute)
-        logger.info(f"Daily summary time set to: {self.daily_summary_time}")
+        logger.info("Daily summary time set to: %s", self.daily_summary_time)
     
     def on_detection(self, detection: Dict[str, Any]) -> None:
         """
@@ -186,8 +295,9 @@ class NotificationScheduler:
                 - image_path: str (optional)
         """
         logger.info(
-            f"Detection received: {detection.get('barn_id')} "
-            f"({detection.get('confidence', 0):.1%})"
+            "Detection received: %s (%.1f%%)",
+            detection.get("barn_id"),
+            detection.get("confidence", 0) * 100,
         )
         
         # Always record for daily summary
@@ -196,34 +306,99 @@ class NotificationScheduler:
         
         # Send immediate notification if enabled
         if self.immediate_enabled:
+            self._dispatch_immediate(detection)
+    
+    def _dispatch_immediate(self, detection: Dict[str, Any]) -> None:
+        """
+        Send an immediate notification, coalescing bursts.
+        
+        The first detection after a quiet period is sent right away and
+        opens a ``debounce_seconds`` window. Detections arriving inside the
+        window are buffered and sent together when it closes (or as soon
+        as ``burst_max`` of them have piled up), so a burst of K detections
+        costs two emails/posts instead of K.
+        """
+        if self.debounce_seconds <= 0:
             self._send_immediate(detection)
+            return
+        
+        batch: Optional[List[Dict]] = None
+        with self._burst_lock:
+            if self._burst_timer is None:
+                self._burst_timer = threading.Timer(self.debounce_seconds, self._flush_burst)
+                self._burst_timer.daemon = True
+                self._burst_timer.start()
+                batch = [detection]
+            else:
+                self._burst_buffer.append(detection)
+                if len(self._burst_buffer) >= self.burst_max:
+                    batch, self._burst_buffer = self._burst_buffer, []
+        
+        if batch:
+            self._send_immediate_batch(batch)
+    
+    def _flush_burst(self) -> None:
+        """Close the debounce window and send whatever it collected."""
+        with self._burst_lock:
+            batch, self._burst_buffer = self._burst_buffer, []
+            self._burst_timer = None
+        
+        if batch:
+            self._send_immediate_batch(batch)
+    
+    def _send_immediate_batch(self, detections: List[Dict[str, Any]]) -> None:
+        """Send one combined notification for several detections."""
+        if len(detections) == 1:
+            self._send_immediate(detections[0])
+            return
+        
+        count = len(detections)
+        email = self.email if self.email_enabled else None
+        discord = self.discord if self.discord_enabled else None
+        
+        # Email
+        if email:
+            email.send(
+                subject=f"[Swine Monitor] {count} Detections",
+                detections=detections
+            )
+            logger.info("Immediate email notification sent (%d detections)", count)
+        
+        # Discord - one message, with the most confident detection's image
+        if discord:
+            body = _discord_detection_list(detections, count)
+            best = max(detections, key=lambda d: d.get("confidence", 0))
+            discord.send(f"🐷 **{count} Detections**\n\n{body}", best.get("image_path"))
+            logger.info("Immediate Discord notification sent (%d detections)", count)
+        
+        # Callback
+        if self._on_notification_sent:
+            self._on_notification_sent("immediate", detections)
     
     def _send_immediate(self, detection: Dict[str, Any]) -> None:
         """Send notification immediately."""
-        barn_id = detection.get("barn_id", "Unknown")
         class_name = detection.get("class_name", "Unknown")
-        conf = detection.get("confidence", 0)
-        timestamp = detection.get("timestamp", "")
-        image_path = detection.get("image_path")
+        email = self.email if self.email_enabled else None
+        discord = self.discord if self.discord_enabled else None
         
         # Email
-        if self.email_enabled and self.email:
-            self.email.send(
+        if email:
+            email.send(
                 subject=f"[Swine Monitor] {class_name} Detected",
                 detections=[detection]
             )
             logger.info("Immediate email notification sent")
         
-        # Discord
-        if self.discord_enabled and self.discord:
+        # Discord - message is only built for Discord-enabled deployments
+        if discord:
             msg = (
                 f"🐷 **{class_name} Detected**\n"
-                f"• Barn: {barn_id}\n"
+                f"• Barn: {detection.get('barn_id', 'Unknown')}\n"
                 f"• Class: {class_name}\n"
-                f"• Confidence: {conf:.1%}\n"
-                f"• Time: {timestamp}"
+                f"• Confidence: {detection.get('confidence', 0):.1%}\n"
+                f"• Time: {detection.get('timestamp', '')}"
             )
-            self.discord.send(msg, image_path)
+            discord.send(msg, detection.get("image_path"))
             logger.info("Immediate Discord notification sent")
         
         # Callback
@@ -231,124 +406,167 @@ class NotificationScheduler:
             self._on_notification_sent("immediate", [detection])
     
     def _queue_detection(self, detection: Dict[str, Any]) -> None:
-        """Add detection to today's queue for daily summary."""
-        with self._lock:
-            self._today_detections.append(detection)
-            logger.debug(f"Detection queued. Total today: {len(self._today_detections)}")
+        """
+        Add detection to today's queue for daily summary.
+        
+        Lock-free: deque.append and len() are atomic in CPython (GIL), and
+        the queue object is never replaced, so no lock is taken on the
+        detection path. The eviction counter is best-effort under races.
+        """
+        queue = self._today_detections
+        if len(queue) == queue.maxlen:
+            self._dropped_today += 1  # append() below evicts the oldest
+        queue.append(detection)
+        logger.debug("Detection queued. Total today: %d", len(queue))
     
     def _scheduler_loop(self) -> None:
-        """Background loop to check and send daily summary."""
-        last_summary_date: Optional[str] = None
+        """
+        Background loop that sleeps until the next daily summary is due.
+        
+        Instead of polling the clock, the thread waits on ``_wake_event``
+        for the exact time left until the summary. The wait is capped at
+        ``MAX_SLEEP`` so wall-clock changes (NTP, DST, suspend) are picked
+        up, and setting the event (settings change, stop) re-plans at once.
+        While the summary is disabled the thread blocks with no timeout;
+        assigning ``daily_summary_enabled`` or ``daily_summary_time`` (or
+        calling stop()) sets the event.
+        """
+        last_summary_ordinal = 0  # date.toordinal() of the last summary sent
         
         while self._running:
             if not self.daily_summary_enabled:
-                time_module.sleep(60)
+                # Nothing is clock-driven while disabled: block until the
+                # daily summary settings are assigned or stop() is called
+                self._wake_event.wait()
+                self._wake_event.clear()
                 continue
             
             now = datetime.now()
-            current_time = now.time()
-            current_date = now.strftime("%Y-%m-%d")
+            delay = self._seconds_until_next_fire(last_summary_ordinal, now)
+            woken = self._wake_event.wait(min(delay, self.MAX_SLEEP))
+            self._wake_event.clear()
             
-            # Check if it's time to send daily summary
-            if (self._is_target_time(current_time, self.daily_summary_time) and 
-                last_summary_date != current_date):
-                
-                self._send_daily_summary()
-                last_summary_date = current_date
+            if woken or delay > self.MAX_SLEEP or not self._running:
+                continue  # Re-plan: settings changed, stopping, or not due yet
             
-            time_module.sleep(30)
+            if self.daily_summary_enabled:
+                # Record the date being served before sending: a slow send
+                # (SMTP retries) finishing after midnight must not mark the
+                # next day as done
+                last_summary_ordinal = (now + timedelta(seconds=delay)).toordinal()
+                self._send_daily_summary()
     
-    def _is_target_time(self, current: time, target: time) -> bool:
-        """Check if current time is within 1 minute of target time."""
-        current_minutes = current.hour * 60 + current.minute
-        target_minutes = target.hour * 60 + target.minute
-        return abs(current_minutes - target_minutes) <= 1
+    def _seconds_until_next_fire(
+        self,
+        last_summary_ordinal: int = 0,
+        now: Optional[datetime] = None,
+    ) -> float:
+        """
+        Seconds from ``now`` until the next daily summary is due.
+        
+        Args:
+            last_summary_ordinal: Ordinal of the date a summary was last
+                                  sent; today's slot is skipped if it matches
+            now: Reference time (defaults to the current time)
+            
+        Returns:
+            Non-negative number of seconds
+        """
+        now = now or datetime.now()
+        target = datetime.combine(now.date(), self.daily_summary_time)
+        if target <= now or now.toordinal() == last_summary_ordinal:
+            target += timedelta(days=1)
+        return max(0.0, (target - now).total_seconds())
     
     def _send_daily_summary(self) -> None:
         """Send daily summary with all detections from the past 24 hours."""
+        # Drain with atomic popleft() so detections appended meanwhile are
+        # either included or stay queued for the next summary, never lost
         with self._lock:
-            detections = self._today_detections.copy()
-            self._today_detections.clear()
+            queue = self._today_detections
+            detections = [queue.popleft() for _ in range(len(queue))]
+            dropped, self._dropped_today = self._dropped_today, 0
+        
+        detection_count = len(detections) + dropped
+        logger.info("Sending daily summary: %d detections", detection_count)
+        if dropped:
+            logger.warning(
+                "Daily cap reached: summary lists the latest %d detections, "
+                "%d older ones were dropped",
+                len(detections),
+                dropped,
+            )
         
-        detection_count = len(detections)
-        logger.info(f"Sending daily summary: {detection_count} detections")
+        email = self.email if self.email_enabled else None
+        discord = self.discord if self.discord_enabled else None
+        
+        # Discord - always send status. Dispatched first: it is queued on the
+        # notifier pool, while the no-detection email below blocks on SMTP.
+        if discord:
+            if detection_count > 0:
+                body = _discord_detection_list(detections, detection_count)
+                discord.send(f"📊 **Daily Summary**\n\n{body}")
+            else:
+                discord.send(
+                    "📊 **Daily Summary**\n\n"
+                    "✅ No mating behavior detected during the past 24 hours."
+                )
         
         # Email - always send, even with no detections
-        if self.email_enabled and self.email:
+        if email:
             if detection_count > 0:
-                self.email.send(
+                email.send(
                     subject=f"[Swine Monitor] Daily Summary ({detection_count} detections)",
                     detections=detections
                 )
             else:
                 self._send_no_detection_email()
         
-        # Discord - always send status
-        if self.discord_enabled and self.discord:
-            if detection_count > 0:
-                summary_lines = ["📊 **Daily Summary**", ""]
-                for d in detections[:10]:
-                    barn = d.get("barn_id", "?")
-                    cls = d.get("class_name", "?")
-                    conf = d.get("confidence", 0)
-                    ts = d.get("timestamp", "?")
-                    summary_lines.append(f"• {barn} [{cls}]: {conf:.1%} @ {ts}")
-                
-                if len(detections) > 10:
-                    summary_lines.append(f"... and {len(detections) - 10} more")
-                
-                self.discord.send("\n".join(summary_lines))
-            else:
-                self.discord.send(
-                    "📊 **Daily Summary**\n\n"
-                    "✅ No mating behavior detected during the past 24 hours."
-                )
-        
         # Callback
         if self._on_notification_sent:
             self._on_notification_sent("daily", detections)
     
     def _send_no_detection_email(self) -> None:
         """Send email when no detections occurred during the day."""
-        body = f"""Swine Monitor - Daily Summary
-{'=' * 40}
-
-Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-✅ No mating behavior was detected during the past 24 hours.
-
-This is a routine status report confirming that the monitoring system
-is operating normally and no mating activity was observed.
-
-{'=' * 40}
-This is an automated message from Swine Monitor System.
-"""
-        
+        email = self.email
         # Guard against None email
-        if not self.email:
+        if not email:
             logger.warning("Cannot send no-detection email: email not configured")
             return
         
+        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S").encode("ascii")
+        
         try:
-            msg = MIMEMultipart()
-            msg["From"] = self.email.smtp_user
-            msg["To"] = self.email.recipient_email
-            msg["Subject"] = "[Swine Monitor] Daily Summary - No Detections"
-            msg.attach(MIMEText(body, "plain", "utf-8"))
+            head, tail = self._get_no_detection_template(email)
+            # Shares the notifier's pooled, already-authenticated connection
+            email.send_raw(head + ts + tail)
             
-            with smtplib.SMTP(self.email.smtp_host, self.email.smtp_port, timeout=30) as server:
-                server.starttls()
-                server.login(self.email.smtp_user, self.email.smtp_password)
-                server.send_message(msg)
-            
-            logger.info(f"No-detection email sent to {self.email.recipient_email}")
+            logger.info("No-detection email sent to %s", email.recipient_email)
         except Exception as e:
-            logger.error(f"Failed to send no-detection email: {e}")
+            logger.error("Failed to send no-detection email: %s", e)
+    
+    def _get_no_detection_template(self, email: EmailNotifier) -> Tuple[bytes, bytes]:
+        """
+        Return the serialized no-detection email split around its timestamp.
+        
+        The message is MIME-encoded once per notifier; each send only joins
+        the two halves with the current timestamp.
+        """
+        cached = self._no_detection_template
+        if cached is None or cached[0] is not email:
+            raw = email.build_message(
+                _NO_DETECTION_SUBJECT, _NO_DETECTION_BODY.format(ts=_TS_PLACEHOLDER)
+            )
+            head, found, tail = raw.partition(_TS_PLACEHOLDER.encode("ascii"))
+            if not found:
+                raise ValueError("Timestamp placeholder missing from encoded email")
+            cached = (email, head, tail)
+            self._no_detection_template = cached
+        return cached[1], cached[2]
     
     def get_pending_count(self) -> int:
         """Get the number of pending detections for daily summary."""
-        with self._lock:
-            return len(self._today_detections)
+        return len(self._today_detections)
     
     def force_send_summary(self) -> None:
         """Manually trigger sending of daily summary."""
@@ -358,9 +576,10 @@ This is an automated message from Swine Monitor System.
     def clear_pending(self) -> None:
         """Clear all pending detections without sending."""
         with self._lock:
-            count = len(self._today_detections)
+            count = len(self._today_detections) + self._dropped_today
             self._today_detections.clear()
-        logger.info(f"Cleared {count} pending detections")
+            self._dropped_today = 0
+        logger.info("Cleared %d pending detections", count)
     
     def set_notification_callback(self, callback: Callable) -> None:
         """Set callback function for notification events."""
@@ -388,144 +607,183 @@ This is an automated message from Swine Monitor System.
             "discord_message": "",
         }
         
-        # Test Email
-        if test_email:
-            if not self.email_enabled or not self.email:
-                results["email_message"] = "Email not configured"
-            else:
-                try:
-                    test_body = f"""Swine Monitor - Test Email
-{'=' * 40}
-
-This is a test email to verify your notification settings.
-
-Sent at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-If you received this email, your email notifications are working correctly!
-
-{'=' * 40}
-"""
-                    msg = MIMEMultipart()
-                    msg["From"] = self.email.smtp_user
-                    msg["To"] = self.email.recipient_email
-                    msg["Subject"] = "[Swine Monitor] Test Notification"
-                    msg.attach(MIMEText(test_body, "plain", "utf-8"))
-                    
-                    with smtplib.SMTP(self.email.smtp_host, self.email.smtp_port, timeout=30) as server:
-                        server.starttls()
-                        server.login(self.email.smtp_user, self.email.smtp_password)
-                        server.send_message(msg)
-                    
-                    results["email_success"] = True
-                    results["email_message"] = f"Test email sent to {self.email.recipient_email}"
-                    logger.info(results["email_message"])
-                    
-                except smtplib.SMTPAuthenticationError:
-                    results["email_message"] = "Authentication failed - check username/password"
-                    logger.error(results["email_message"])
-                except smtplib.SMTPException as e:
-                    results["email_message"] = f"SMTP error: {e}"
-                    logger.error(results["email_message"])
-                except Exception as e:
-                    results["email_message"] = f"Error: {e}"
-                    logger.error(results["email_message"])
-        
-        # Test Discord
+        # The two checks are independent network round trips, so when both
+        # are requested Discord runs on a helper thread alongside the email
+        discord_thread: Optional[threading.Thread] = None
         if test_discord:
-            if not self.discord_enabled:
-                results["discord_message"] = "Discord not enabled"
-            elif not self.discord or not self.discord.webhook_url:
-                results["discord_success"] = False
-                results["discord_message"] = "Discord webhook URL not configured"
+            if test_email:
+                discord_thread = threading.Thread(
+                    target=self._test_discord_channel, args=(results,), daemon=True
+                )
+                discord_thread.start()
             else:
-                try:
-                    import requests
-                    test_msg = (
-                        "🧪 **Swine Monitor - Test Notification**\n\n"
-                        f"Sent at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-                        "If you see this message, Discord notifications are working!"
-                    )
-                    response = requests.post(
-                        self.discord.webhook_url,
-                        json={"content": test_msg},
-                        timeout=10
-                    )
-                    if response.status_code in [200, 204]:
-                        results["discord_success"] = True
-                        results["discord_message"] = "Test message sent to Discord"
-                        logger.info(results["discord_message"])
-                    else:
-                        results["discord_message"] = f"Discord error: {response.status_code}"
-                        logger.error(results["discord_message"])
-                except Exception as e:
-                    results["discord_message"] = f"Error: {e}"
-                    logger.error(results["discord_message"])
+                self._test_discord_channel(results)
+        
+        if test_email:
+            self._test_email_channel(results)
+        
+        if discord_thread is not None:
+            discord_thread.join()
         
         return results
+    
+    def _test_email_channel(self, results: Dict[str, Any]) -> None:
+        """Send the test email and record the outcome in ``results``."""
+        email = self.email
+        if not self.email_enabled or not email:
+            results["email_message"] = "Email not configured"
+            return
+        
+        try:
+            test_body = _TEST_EMAIL_BODY.format(ts=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            email.send_text("[Swine Monitor] Test Notification", test_body)
+            
+            results["email_success"] = True
+            results["email_message"] = f"Test email sent to {email.recipient_email}"
+            logger.info(results["email_message"])
+            
+        except smtplib.SMTPAuthenticationError:
+            results["email_message"] = "Authentication failed - check username/password"
+            logger.error(results["email_message"])
+        except smtplib.SMTPException as e:
+            results["email_message"] = f"SMTP error: {e}"
+            logger.error(results["email_message"])
+        except Exception as e:
+            results["email_message"] = f"Error: {e}"
+            logger.error(results["email_message"])
+    
+    def _test_discord_channel(self, results: Dict[str, Any]) -> None:
+        """Send the Discord test message and record the outcome in ``results``."""
+        if not self.discord_enabled:
+            results["discord_message"] = "Discord not enabled"
+            return
+        discord = self.discord
+        if not discord or not discord.webhook_url:
+            results["discord_success"] = False
+            results["discord_message"] = "Discord webhook URL not configured"
+            return
+        
+        try:
+            test_msg = (
+                "🧪 **Swine Monitor - Test Notification**\n\n"
+                f"Sent at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+                "If you see this message, Discord notifications are working!"
+            )
+            # Reuses the notifier's keep-alive session (and its retries)
+            discord.send_text(test_msg, timeout=10)
+            results["discord_success"] = True
+            results["discord_message"] = "Test message sent to Discord"
+            logger.info(results["discord_message"])
+        except requests.HTTPError as e:
+            results["discord_message"] = f"Discord error: {e.response.status_code}"
+            logger.error(results["discord_message"])
+        except Exception as e:
+            results["discord_message"] = f"Error: {e}"
+            logger.error(results["discord_message"])
 
 
 # =============================================================================
 # Convenience function for quick setup
 # =============================================================================
 
-def create_scheduler_from_env(db: Optional[Database] = None) -> NotificationScheduler:
+@dataclass(frozen=True, slots=True)
+class NotificationEnvConfig:
+    """Notification settings read from the environment (see _load_env_config)."""
+    
+    immediate_enabled: bool
+    daily_summary_enabled: bool
+    daily_summary_time: str
+    email_enabled: bool
+    smtp_host: str
+    smtp_port: str
+    smtp_user: str
+    smtp_password: str = field(repr=False)
+    recipient_email: str
+    discord_enabled: bool
+    discord_webhook_url: str = field(repr=False)
+
+
+def _env_flag(key: str, default: str) -> bool:
+    """Read a "true"/"false" environment variable."""
+    return os.getenv(key, default).lower() == "true"
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env_config() -> NotificationEnvConfig:
     """
-    Create a NotificationScheduler using environment variables.
+    Load .env and snapshot the notification settings.
     
-    Environment variables used:
-        - SMTP_USER, SMTP_PASSWORD, RECIPIENT_EMAIL (for email)
-        - DISCORD_WEBHOOK_URL (for Discord)
-        - IMMEDIATE_ENABLED (true/false)
-        - DAILY_SUMMARY_ENABLED (true/false)
-        - DAILY_SUMMARY_TIME (HH:MM format)
+    Cached so repeated scheduler construction does not re-parse .env;
+    call ``_load_env_config.cache_clear()`` (or pass ``reload=True`` to
+    create_scheduler_from_env) after the environment changes.
     """
     from dotenv import load_dotenv
     load_dotenv()
     
-    # Read enabled flags from environment
-    master_enabled = os.getenv("NOTIFICATIONS_ENABLED", "true").lower() == "true"
-    email_enabled_env = os.getenv("EMAIL_ENABLED", "true").lower() == "true"
-    discord_enabled_env = os.getenv("DISCORD_ENABLED", "false").lower() == "true"
-    
-    immediate_enabled = os.getenv("IMMEDIATE_ENABLED", "true").lower() == "true"
-    daily_enabled = os.getenv("DAILY_SUMMARY_ENABLED", "false").lower() == "true"
+    immediate_enabled = _env_flag("IMMEDIATE_ENABLED", "true")
+    daily_enabled = _env_flag("DAILY_SUMMARY_ENABLED", "false")
     
     # Apply master switch
-    if not master_enabled:
+    if not _env_flag("NOTIFICATIONS_ENABLED", "true"):
         immediate_enabled = False
         daily_enabled = False
     
-    scheduler = NotificationScheduler(db=db)
-    
-    # Set notification modes
-    scheduler.immediate_enabled = immediate_enabled
-    scheduler.daily_summary_enabled = daily_enabled
-    scheduler.daily_summary_time = NotificationScheduler._parse_time(
-        os.getenv("DAILY_SUMMARY_TIME", "09:00")
+    return NotificationEnvConfig(
+        immediate_enabled=immediate_enabled,
+        daily_summary_enabled=daily_enabled,
+        daily_summary_time=os.getenv("DAILY_SUMMARY_TIME", "09:00"),
+        email_enabled=_env_flag("EMAIL_ENABLED", "true"),
+        smtp_host=os.getenv("SMTP_HOST", "smtp.gmail.com"),
+        smtp_port=os.getenv("SMTP_PORT", "587"),
+        smtp_user=os.getenv("SMTP_USER", ""),
+        smtp_password=os.getenv("SMTP_PASSWORD", ""),
+        recipient_email=os.getenv("RECIPIENT_EMAIL", ""),
+        discord_enabled=_env_flag("DISCORD_ENABLED", "false"),
+        discord_webhook_url=os.getenv("DISCORD_WEBHOOK_URL", ""),
     )
+
+
+def create_scheduler_from_env(
+    db: Optional[Database] = None,
+    reload: bool = False,
+) -> NotificationScheduler:
+    """
+    Create a NotificationScheduler using environment variables.
     
-    # Email configuration
-    smtp_password = os.getenv("SMTP_PASSWORD", "")
-    smtp_user = os.getenv("SMTP_USER", "")
-    if email_enabled_env and smtp_user and smtp_password:
-        scheduler.email = EmailNotifier(
-            smtp_host=os.getenv("SMTP_HOST", "smtp.gmail.com"),
-            smtp_port=int(os.getenv("SMTP_PORT", "587")),
-            smtp_user=smtp_user,
-            smtp_password=smtp_password,
-            recipient_email=os.getenv("RECIPIENT_EMAIL", ""),
-        )
-        scheduler.email_enabled = True
-    else:
-        scheduler.email_enabled = False
-    
-    # Discord configuration
-    discord_url = os.getenv("DISCORD_WEBHOOK_URL", "")
-    if discord_enabled_env and discord_url:
-        scheduler.discord = DiscordNotifier(discord_url)
-        scheduler.discord_enabled = True
-    else:
-        scheduler.discord_enabled = False
+    Environment variables used:
+        - SMTP_USER, SMTP_PASSWORD, RECIPIENT_EMAIL (for email)
+        - DISCORD_WEBHOOK_URL (for Discord)
+        - IMMEDIATE_ENABLED (true/false)
+        - DAILY_SUMMARY_ENABLED (true/false)
+        - DAILY_SUMMARY_TIME (HH:MM format)
+    
+    Args:
+        db: Database instance
+        reload: Re-read the environment instead of reusing the settings
+                snapshot from a previous call (use after .env changes)
+    """
+    if reload:
+        _load_env_config.cache_clear()
+    env = _load_env_config()
+    
+    # Email needs credentials when configured from the environment
+    email_enabled = env.email_enabled and bool(env.smtp_user and env.smtp_password)
+    
+    # Same settings shape as config.yaml, so both sources share from_config
+    config = {
+        "immediate_enabled": env.immediate_enabled,
+        "daily_summary_enabled": env.daily_summary_enabled,
+        "daily_summary_time": env.daily_summary_time,
+        "email_enabled": email_enabled,
+        "smtp_host": env.smtp_host,
+        "smtp_port": int(env.smtp_port) if email_enabled else 587,
+        "smtp_user": env.smtp_user,
+        "smtp_password": env.smtp_password,
+        "recipient_email": env.recipient_email,
+        "discord_enabled": env.discord_enabled,
+        "discord_webhook_url": env.discord_webhook_url,
+    }
+    scheduler = NotificationScheduler.from_config(config, db=db)
     
     return scheduler
 
@@ -5,17 +5,25 @@ Utility Functions
 Common utility functions used across the application.
 """
 
+import functools
+import json
+import os
+import re
 import sys
+import tempfile
 from pathlib import Path
+from typing import Any, Mapping, Union
 
 
+@functools.lru_cache(maxsize=1)
 def get_base_dir() -> Path:
     """
     Get the base directory of the application.
     
     Returns the appropriate base directory depending on whether
     the application is running as a frozen executable (PyInstaller)
-    or as Python source code.
+    or as Python source code. The result is fixed for the lifetime of
+    the process, so it is computed once and cached.
     
     Returns:
         Path: The base directory path.
@@ -30,3 +38,159 @@ def get_base_dir() -> Path:
     else:
         # Running as source code
         return Path(__file__).resolve().parent.parent
+
+
+def load_yaml(path: Union[str, Path]) -> dict[str, Any]:
+    """
+    Load a YAML mapping using the libyaml C loader when available.
+    
+    PyYAML is imported on first use so modules that only need the helper
+    signature do not pay for it at import time.
+    
+    Args:
+        path: Path to the YAML file.
+        
+    Returns:
+        dict: Parsed mapping, or an empty dict for an empty file.
+        
+    Examples:
+        >>> config = load_yaml(get_base_dir() / "config.yaml")
+    """
+    import yaml
+    
+    # Prefer the libyaml-backed C loader; fall back to pure Python
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=loader) or {}
+
+
+def load_config_cached(path: Union[str, Path]) -> dict[str, Any]:
+    """
+    Load a YAML config, reusing a JSON sidecar when the YAML is unchanged.
+    
+    The sidecar (``<name>.cache.json`` next to the file) stores the YAML
+    file's mtime alongside the parsed data, so a stale cache is detected
+    even if both files share a timestamp. Parsing JSON with the stdlib C
+    decoder is much cheaper than parsing YAML.
+    
+    Args:
+        path: Path to the YAML file.
+        
+    Returns:
+        dict: Parsed mapping, or an empty dict for an empty file.
+        
+    Examples:
+        >>> config = load_config_cached(get_base_dir() / "config.yaml")
+    """
+    path = Path(path)
+    yaml_mtime = path.stat().st_mtime_ns
+    cache_path = path.with_name(path.name + ".cache.json")
+    
+    if cache_path.exists():
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("mtime_ns") == yaml_mtime:
+                return cached.get("data") or {}
+        except (OSError, ValueError):
+            pass  # Corrupt or unreadable cache; fall back to YAML
+    
+    data = load_yaml(path)
+    
+    try:
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump({"mtime_ns": yaml_mtime, "data": data}, f)
+    except (OSError, TypeError):
+        pass  # Cache is an optimization only
+    
+    return data
+
+
+def save_yaml(path: Union[str, Path], data: Mapping[str, Any]) -> None:
+    """
+    Write a mapping as block-style YAML, keeping key order.
+    
+    The data is written and fsynced to a temporary file in the same
+    directory, which then atomically replaces the destination, so a crash
+    mid-write never leaves a truncated file behind.
+    
+    Args:
+        path: Destination file path.
+        data: Mapping to serialize.
+        
+    Examples:
+        >>> save_yaml(get_base_dir() / "config.yaml", {"detection": {"target_class": 1}})
+    """
+    import yaml
+    
+    path = Path(path)
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            yaml.dump(data, f, Dumper=dumper, default_flow_style=False, sort_keys=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+_ENV_KEY_PATTERN = re.compile(r"^\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_.]*)\s*=")
+
+
+def update_env_file(env_path: Union[str, Path], values: Mapping[str, str]) -> None:
+    """
+    Set several keys in a .env file with a single read and write.
+    
+    Equivalent to calling ``dotenv.set_key`` once per key, but the file is
+    parsed and rewritten only once. Existing lines (including comments) are
+    preserved, matching keys are replaced in place, and new keys are
+    appended. The file is replaced atomically via a temporary file.
+    
+    Args:
+        env_path: Path to the .env file. Created if it does not exist.
+        values: Mapping of keys to their new (unquoted) values.
+        
+    Examples:
+        >>> update_env_file(".env", {"SMTP_HOST": "smtp.gmail.com", "SMTP_PORT": "587"})
+    """
+    env_path = Path(env_path)
+    pending = dict(values)
+    
+    lines: list[str] = []
+    if env_path.exists():
+        with open(env_path, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+    
+    def format_line(key: str, value: str) -> str:
+        # Same quoting as dotenv.set_key (quote_mode="always")
+        escaped = str(value).replace("'", "\\'")
+        return f"{key}='{escaped}'\n"
+    
+    replaced: set[str] = set()
+    for i, line in enumerate(lines):
+        match = _ENV_KEY_PATTERN.match(line)
+        if match and match.group(1) in pending:
+            key = match.group(1)
+            lines[i] = format_line(key, pending[key])
+            replaced.add(key)
+    
+    missing = [key for key in pending if key not in replaced]
+    if missing:
+        if lines and not lines[-1].endswith("\n"):
+            lines[-1] += "\n"
+        lines.extend(format_line(key, pending[key]) for key in missing)
+    
+    env_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=env_path.parent, prefix=".env.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.writelines(lines)
+        os.replace(tmp_path, env_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -6,6 +6,7 @@ Interactive CLI tool to test SMTP connectivity with various email providers.
 
 Usage:
     uv run python -m tests.test_smtp
+    uv run python -m tests.test_smtp --probe-all   # check every preset at once
 
 Note: This is an interactive CLI tool, not automated unit tests.
       Functions are prefixed with 'check_' instead of 'test_' to avoid
@@ -13,49 +14,141 @@ Note: This is an interactive CLI tool, not automated unit tests.
 """
 
 
+import argparse
+import re
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import ssl
+from concurrent.futures import ThreadPoolExecutor
+from email.message import EmailMessage
 import getpass
 import sys
+from typing import Optional
 
+# One client TLS context for the whole run: CA certificates are loaded once,
+# and STARTTLS verifies the server certificate and hostname.
+_TLS_CTX = ssl.create_default_context()
 
-def check_smtp_connection(host: str, port: int) -> bool:
-    """Check basic SMTP connection."""
+# Body of the test email; only the headers differ between sends
+_TEST_EMAIL_BODY = """
+This is a test email from the Swine Monitor system.
+
+If you received this email, the SMTP configuration is working correctly!
+
+---
+Swine Monitor System
+"""
+
+# SMTP Settings
+SMTP_CONFIGS = [
+    ("smtp.gmail.com", 587, "Gmail"),
+    ("smtp.office365.com", 587, "Office 365"),
+    ("smtp.tokushima-u.ac.jp", 587, "Tokushima University"),
+]
+
+
+class PipelinedSMTP(smtplib.SMTP):
+    """
+    SMTP client that batches the mail envelope when the server allows it.
+    
+    With the PIPELINING extension (RFC 2920), MAIL FROM, every RCPT TO and
+    DATA are written in one go and their replies read back in order, so
+    the envelope costs one round trip instead of one per command. Servers
+    without the extension get the stock smtplib behaviour.
+    """
+    
+    def sendmail(self, from_addr, to_addrs, msg, mail_options=(), rcpt_options=()):
+        self.ehlo_or_helo_if_needed()
+        if not self.has_extn("pipelining") or mail_options or rcpt_options:
+            return super().sendmail(from_addr, to_addrs, msg, mail_options, rcpt_options)
+        
+        if isinstance(msg, str):
+            msg = re.sub(r"(?:\r\n|\n|\r(?!\n))", "\r\n", msg).encode("ascii")
+        if isinstance(to_addrs, str):
+            to_addrs = [to_addrs]
+        
+        commands = [f"MAIL FROM:{smtplib.quoteaddr(from_addr)}"]
+        commands += [f"RCPT TO:{smtplib.quoteaddr(addr)}" for addr in to_addrs]
+        commands.append("DATA")
+        self.send("".join(f"{command}\r\n" for command in commands))
+        
+        # Every queued command gets a reply, read in submission order
+        mail_reply = self.getreply()
+        rcpt_replies = [self.getreply() for _ in to_addrs]
+        data_code, data_resp = self.getreply()
+        
+        senderrs = {
+            addr: reply
+            for addr, reply in zip(to_addrs, rcpt_replies)
+            if reply[0] not in (250, 251)
+        }
+        
+        if mail_reply[0] != 250 or len(senderrs) == len(to_addrs) or data_code != 354:
+            if data_code == 354:
+                # An accepted DATA cannot be aborted without sending a
+                # message, so drop the connection instead
+                self.close()
+            else:
+                self._rset()
+            if mail_reply[0] != 250:
+                if mail_reply[0] == 421:
+                    self.close()
+                raise smtplib.SMTPSenderRefused(mail_reply[0], mail_reply[1], from_addr)
+            if len(senderrs) == len(to_addrs):
+                raise smtplib.SMTPRecipientsRefused(senderrs)
+            raise smtplib.SMTPDataError(data_code, data_resp)
+        
+        # Dot-stuff the body and terminate it (RFC 5321 section 4.5.2)
+        body = re.sub(rb"(?m)^\.", b"..", msg)
+        if body[-2:] != b"\r\n":
+            body += b"\r\n"
+        self.send(body + b".\r\n")
+        code, resp = self.getreply()
+        if code != 250:
+            if code == 421:
+                self.close()
+            else:
+                self._rset()
+            raise smtplib.SMTPDataError(code, resp)
+        return senderrs
+
+
+def check_smtp_connection(host: str, port: int) -> Optional[smtplib.SMTP]:
+    """
+    Check basic SMTP connection.
+    
+    Returns:
+        The connected server, reused by the remaining checks, or None.
+    """
     print(f"\n[1/4] Testing connection to {host}:{port}...")
     try:
-        server = smtplib.SMTP(host, port, timeout=10)
+        server = PipelinedSMTP(host, port, timeout=10)
+        server.ehlo()
         print(f"  ✅ Connected to {host}:{port}")
-        server.quit()
-        return True
+        return server
     except Exception as e:
         print(f"  ❌ Connection failed: {e}")
-        return False
+        return None
 
 
-def check_tls(host: str, port: int) -> bool:
-    """Check TLS/STARTTLS support."""
+def check_tls(server: smtplib.SMTP) -> bool:
+    """Check TLS/STARTTLS support on an open connection."""
     print("\n[2/4] Testing TLS encryption...")
     try:
-        server = smtplib.SMTP(host, port, timeout=10)
-        server.starttls()
+        server.starttls(context=_TLS_CTX)
+        server.ehlo()  # Capabilities must be re-read after STARTTLS
         print("  ✅ TLS encryption established")
-        server.quit()
         return True
     except Exception as e:
         print(f"  ❌ TLS failed: {e}")
         return False
 
 
-def check_authentication(host: str, port: int, user: str, password: str) -> bool:
-    """Check SMTP authentication."""
+def check_authentication(server: smtplib.SMTP, user: str, password: str) -> bool:
+    """Check SMTP authentication on a TLS-secured connection."""
     print(f"\n[3/4] Testing authentication for {user}...")
     try:
-        server = smtplib.SMTP(host, port, timeout=10)
-        server.starttls()
         server.login(user, password)
         print("  ✅ Authentication successful")
-        server.quit()
         return True
     except smtplib.SMTPAuthenticationError as e:
         print(f"  ❌ Authentication failed: {e}")
@@ -67,30 +160,18 @@ def check_authentication(host: str, port: int, user: str, password: str) -> bool
         return False
 
 
-def check_send_email(host: str, port: int, user: str, password: str, recipient: str) -> bool:
-    """Send a test email."""
+def check_send_email(server: smtplib.SMTP, user: str, recipient: str) -> bool:
+    """Send a test email over an authenticated connection."""
     print(f"\n[4/4] Sending test email to {recipient}...")
     try:
-        msg = MIMEMultipart()
+        # A single text/plain part; no multipart wrapper is needed
+        msg = EmailMessage()
         msg['From'] = user
         msg['To'] = recipient
         msg['Subject'] = "[Test] Swine Monitor SMTP Test"
+        msg.set_content(_TEST_EMAIL_BODY)
         
-        body = """
-This is a test email from the Swine Monitor system.
-
-If you received this email, the SMTP configuration is working correctly!
-
----
-Swine Monitor System
-        """
-        msg.attach(MIMEText(body, 'plain'))
-        
-        server = smtplib.SMTP(host, port, timeout=10)
-        server.starttls()
-        server.login(user, password)
         server.send_message(msg)
-        server.quit()
         
         print("  ✅ Test email sent successfully!")
         print(f"     Check inbox: {recipient}")
@@ -100,18 +181,67 @@ Swine Monitor System
         return False
 
 
+def close_connection(server: smtplib.SMTP) -> None:
+    """Quit the session, ignoring errors from an already dropped connection."""
+    try:
+        server.quit()
+    except (smtplib.SMTPException, OSError):
+        server.close()
+
+
+def probe_server(host: str, port: int) -> str:
+    """
+    Connect, upgrade to TLS and report what the server advertises.
+    
+    Returns:
+        One-line summary of the server's extensions after STARTTLS.
+        
+    Raises:
+        Exception: Any connection or TLS error, for the caller to report.
+    """
+    with smtplib.SMTP(host, port, timeout=10) as server:
+        server.starttls(context=_TLS_CTX)
+        server.ehlo()
+        auth = server.esmtp_features.get("auth", "").strip() or "none"
+        pipelining = "yes" if server.has_extn("pipelining") else "no"
+        return f"TLS ok, AUTH: {auth}, PIPELINING: {pipelining}"
+
+
+def probe_all() -> None:
+    """Probe every preset server concurrently and print one line per server."""
+    print(f"\nProbing {len(SMTP_CONFIGS)} SMTP servers...")
+    
+    # Each probe is dominated by TCP connect and the TLS handshake, so
+    # running them side by side takes as long as the slowest server
+    def _probe(config: tuple[str, int, str]) -> str:
+        host, port, name = config
+        try:
+            return f"  ✅ {name} ({host}:{port}): {probe_server(host, port)}"
+        except Exception as e:
+            return f"  ❌ {name} ({host}:{port}): {e}"
+    
+    with ThreadPoolExecutor(max_workers=len(SMTP_CONFIGS)) as pool:
+        for line in pool.map(_probe, SMTP_CONFIGS):
+            print(line)
+
+
 def main():
     """Interactive SMTP configuration test."""
+    parser = argparse.ArgumentParser(description="SMTP connection test for Swine Monitor")
+    parser.add_argument(
+        "--probe-all",
+        action="store_true",
+        help="check connection and TLS for every preset server, then exit",
+    )
+    args = parser.parse_args()
+    
     print("=" * 50)
     print("SMTP Connection Test for Swine Monitor")
     print("=" * 50)
     
-    # SMTP Settings
-    SMTP_CONFIGS = [
-        ("smtp.gmail.com", 587, "Gmail"),
-        ("smtp.office365.com", 587, "Office 365"),
-        ("smtp.tokushima-u.ac.jp", 587, "Tokushima University"),
-    ]
+    if args.probe_all:
+        probe_all()
+        return
     
     print("\nAvailable SMTP configurations:")
     for i, (host, port, name) in enumerate(SMTP_CONFIGS, 1):
@@ -132,32 +262,37 @@ def main():
     
     print(f"\nUsing: {smtp_host}:{smtp_port}")
     
-    # Test 1: Connection
-    if not check_smtp_connection(smtp_host, smtp_port):
+    # Test 1: Connection. The same session is reused for every later step,
+    # so TCP connect and the TLS handshake happen only once.
+    server = check_smtp_connection(smtp_host, smtp_port)
+    if server is None:
         print("\n⛔ Cannot connect. Please check network/firewall settings.")
         sys.exit(1)
     
-    # Test 2: TLS
-    if not check_tls(smtp_host, smtp_port):
-        print("\n⛔ TLS not supported. Try a different port.")
-        sys.exit(1)
-    
-    # Test 3: Authentication
-    print("\n" + "-" * 50)
-    email = input("Enter your email address: ").strip()
-    password = getpass.getpass("Enter password (or App Password): ")
-    
-    if not check_authentication(smtp_host, smtp_port, email, password):
-        print("\n⛔ Authentication failed. Check credentials or create App Password.")
-        sys.exit(1)
-    
-    # Test 4: Send email (optional)
-    print("\n" + "-" * 50)
-    send_test = input("Send a test email? [y/N]: ").strip().lower()
-    
-    if send_test == 'y':
-        recipient = input(f"Recipient email [{email}]: ").strip() or email
-        check_send_email(smtp_host, smtp_port, email, password, recipient)
+    try:
+        # Test 2: TLS
+        if not check_tls(server):
+            print("\n⛔ TLS not supported. Try a different port.")
+            sys.exit(1)
+        
+        # Test 3: Authentication
+        print("\n" + "-" * 50)
+        email = input("Enter your email address: ").strip()
+        password = getpass.getpass("Enter password (or App Password): ")
+        
+        if not check_authentication(server, email, password):
+            print("\n⛔ Authentication failed. Check credentials or create App Password.")
+            sys.exit(1)
+        
+        # Test 4: Send email (optional)
+        print("\n" + "-" * 50)
+        send_test = input("Send a test email? [y/N]: ").strip().lower()
+        
+        if send_test == 'y':
+            recipient = input(f"Recipient email [{email}]: ").strip() or email
+            check_send_email(server, email, recipient)
+    finally:
+        close_connection(server)
     
     # Summary
     print("\n" + "=" * 50)
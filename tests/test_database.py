@@ -12,7 +12,6 @@ Usage:
 
 import os
 import sys
-import tempfile
 from datetime import datetime
 from pathlib import Path
 
@@ -30,31 +29,42 @@ from src.database import Database
 # =============================================================================
 
 @pytest.fixture
-def temp_db():
-    """Create a temporary database for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test_detections.db"
-        db = Database(db_path=db_path)
-        yield db
-        # Cleanup is automatic with TemporaryDirectory
+def temp_db(tmp_path):
+    """Create a temporary database for testing (unique per test and worker)."""
+    return Database(db_path=tmp_path / "test_detections.db")
 
 
 @pytest.fixture
-def populated_db(temp_db):
-    """Create a database with sample data."""
-    # Insert test records
-    test_data = [
-        ("data/images/test1.jpg", 0.95, True, "Detection 1", "Barn 1"),
-        ("data/images/test2.jpg", 0.87, True, "Detection 2", "Barn 2"),
-        ("data/images/test3.jpg", 0.72, True, "Detection 3", "Barn 1"),
-        ("data/images/test4.jpg", 0.91, True, "Detection 4", "Barn 3"),
-        ("data/images/test5.jpg", 0.65, False, "False positive", "Barn 2"),
-    ]
-    
-    for image_path, confidence, is_mounting, details, barn_id in test_data:
-        temp_db.log_detection(image_path, confidence, is_mounting, details, barn_id)
-    
-    return temp_db
+def mem_db():
+    """Create an in-memory database for tests that never touch the file."""
+    return Database(db_path=":memory:")
+
+
+# Rows every populated_db test starts from
+SEED_ROWS = [
+    ("data/images/test1.jpg", 0.95, True, "Detection 1", "Barn 1"),
+    ("data/images/test2.jpg", 0.87, True, "Detection 2", "Barn 2"),
+    ("data/images/test3.jpg", 0.72, True, "Detection 3", "Barn 1"),
+    ("data/images/test4.jpg", 0.91, True, "Detection 4", "Barn 3"),
+    ("data/images/test5.jpg", 0.65, False, "False positive", "Barn 2"),
+]
+
+
+@pytest.fixture(scope="session")
+def seeded_db():
+    """Create an in-memory database with the sample data, once per session."""
+    db = Database(db_path=":memory:")
+    db.log_detections(SEED_ROWS)
+    return db
+
+
+@pytest.fixture
+def populated_db(seeded_db):
+    """Provide the shared sample database, undoing rows a test adds."""
+    yield seeded_db
+    # Seed rows hold the first ids, so anything later was added by the test
+    with seeded_db._connect() as conn:
+        conn.execute("DELETE FROM detections WHERE id > ?", (len(SEED_ROWS),))
 
 
 # =============================================================================
@@ -68,12 +78,24 @@ class TestDatabaseInit:
         """Test that initialization creates the database file."""
         assert temp_db.db_path.exists()
     
-    def test_init_creates_directory(self):
+    def test_init_creates_directory(self, tmp_path):
         """Test that initialization creates parent directories."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "subdir" / "nested" / "test.db"
-            db = Database(db_path=db_path)
-            assert db_path.exists()
+        db_path = tmp_path / "subdir" / "nested" / "test.db"
+        db = Database(db_path=db_path)
+        assert db_path.exists()
+    
+    def test_init_in_memory_instances_are_isolated(self):
+        """Test that each ':memory:' database keeps its own rows and cameras."""
+        db1 = Database(db_path=":memory:")
+        db2 = Database(db_path=":memory:")
+        
+        db1.log_detection("test.jpg", 0.9, True, "In memory", "Barn 1")
+        db1.add_camera("Cam 1", "0")
+        
+        assert len(db1.get_logs()) == 1
+        assert db2.get_logs() == []
+        assert len(db1.get_cameras_cached()) == 1
+        assert db2.get_cameras_cached() == []
     
     def test_init_creates_table(self, temp_db):
         """Test that initialization creates the detections table."""
@@ -113,9 +135,9 @@ class TestDatabaseInit:
 class TestLogDetection:
     """Tests for the log_detection method."""
     
-    def test_log_detection_inserts_record(self, temp_db):
+    def test_log_detection_inserts_record(self, mem_db):
         """Test that log_detection inserts a record."""
-        temp_db.log_detection(
+        mem_db.log_detection(
             image_path="test.jpg",
             confidence=0.92,
             is_mounting=True,
@@ -123,12 +145,12 @@ class TestLogDetection:
             barn_id="Barn 1"
         )
         
-        logs = temp_db.get_logs(limit=10)
+        logs = mem_db.get_logs(limit=10)
         assert len(logs) == 1
     
-    def test_log_detection_stores_correct_values(self, temp_db):
+    def test_log_detection_stores_correct_values(self, mem_db):
         """Test that log_detection stores correct values."""
-        temp_db.log_detection(
+        mem_db.log_detection(
             image_path="path/to/image.jpg",
             confidence=0.85,
             is_mounting=True,
@@ -136,7 +158,7 @@ class TestLogDetection:
             barn_id="Barn 3"
         )
         
-        logs = temp_db.get_logs(limit=1)
+        logs = mem_db.get_logs(limit=1)
         assert len(logs) == 1
         
         log = logs[0]
@@ -147,38 +169,38 @@ class TestLogDetection:
         assert log[5] == "Detection details"  # details
         assert log[6] == "Barn 3"  # barn_id
     
-    def test_log_detection_default_barn_id(self, temp_db):
+    def test_log_detection_default_barn_id(self, mem_db):
         """Test that barn_id defaults to 'Unknown'."""
-        temp_db.log_detection(
+        mem_db.log_detection(
             image_path="test.jpg",
             confidence=0.75,
             is_mounting=True,
             details="No barn specified"
         )
         
-        logs = temp_db.get_logs(limit=1)
+        logs = mem_db.get_logs(limit=1)
         assert logs[0][6] == "Unknown"  # barn_id
     
-    def test_log_detection_timestamp_is_set(self, temp_db):
+    def test_log_detection_timestamp_is_set(self, mem_db):
         """Test that timestamp is automatically set."""
-        temp_db.log_detection(
+        mem_db.log_detection(
             image_path="test.jpg",
             confidence=0.80,
             is_mounting=True,
             details="Check timestamp"
         )
         
-        logs = temp_db.get_logs(limit=1)
+        logs = mem_db.get_logs(limit=1)
         timestamp = logs[0][1]
         
         # Verify timestamp is not empty and looks like a datetime
         assert timestamp is not None
         assert len(timestamp) >= 10  # At least YYYY-MM-DD
     
-    def test_log_detection_multiple_records(self, temp_db):
+    def test_log_detection_multiple_records(self, mem_db):
         """Test logging multiple records."""
         for i in range(5):
-            temp_db.log_detection(
+            mem_db.log_detection(
                 image_path=f"test_{i}.jpg",
                 confidence=0.5 + i * 0.1,
                 is_mounting=True,
@@ -186,14 +208,26 @@ class TestLogDetection:
                 barn_id=f"Barn {i % 2 + 1}"
             )
         
-        logs = temp_db.get_logs(limit=10)
+        logs = mem_db.get_logs(limit=10)
         assert len(logs) == 5
     
-    def test_log_detection_special_characters(self, temp_db):
+    def test_log_detections_batch_defaults(self, mem_db):
+        """Test that log_detections inserts every row and fills in defaults."""
+        mem_db.log_detections([
+            ("a.jpg", 0.9, True, "With class", "Barn 1", "mounting"),
+            ("b.jpg", 0.8, True, "No barn"),
+        ])
+        
+        logs = mem_db.get_logs(limit=10)
+        assert len(logs) == 2
+        assert logs[0][6] == "Unknown" and logs[0][7] == "Unknown"  # barn_id, class_name
+        assert logs[1][6] == "Barn 1" and logs[1][7] == "mounting"
+    
+    def test_log_detection_special_characters(self, mem_db):
         """Test handling of special characters in details."""
         special_details = "日本語テスト / Special chars: !@#$%^&*()"
         
-        temp_db.log_detection(
+        mem_db.log_detection(
             image_path="test.jpg",
             confidence=0.9,
             is_mounting=True,
@@ -201,7 +235,7 @@ class TestLogDetection:
             barn_id="Barn 1"
         )
         
-        logs = temp_db.get_logs(limit=1)
+        logs = mem_db.get_logs(limit=1)
         assert logs[0][5] == special_details
 
 
@@ -212,14 +246,14 @@ class TestLogDetection:
 class TestGetLogs:
     """Tests for the get_logs method."""
     
-    def test_get_logs_returns_list(self, temp_db):
+    def test_get_logs_returns_list(self, mem_db):
         """Test that get_logs returns a list."""
-        logs = temp_db.get_logs()
+        logs = mem_db.get_logs()
         assert isinstance(logs, list)
     
-    def test_get_logs_empty_database(self, temp_db):
+    def test_get_logs_empty_database(self, mem_db):
         """Test get_logs on empty database."""
-        logs = temp_db.get_logs()
+        logs = mem_db.get_logs()
         assert logs == []
     
     def test_get_logs_respects_limit(self, populated_db):
@@ -229,15 +263,9 @@ class TestGetLogs:
     
     def test_get_logs_default_limit(self, populated_db):
         """Test default limit of 50."""
-        # Add more than 50 records
-        for i in range(60):
-            populated_db.log_detection(
-                image_path=f"extra_{i}.jpg",
-                confidence=0.8,
-                is_mounting=True,
-                details=f"Extra {i}",
-                barn_id="Barn X"
-            )
+        # Add more than 50 records, in one transaction
+        rows = [(f"extra_{i}.jpg", 0.8, True, f"Extra {i}", "Barn X") for i in range(60)]
+        populated_db.log_detections(rows)
         
         logs = populated_db.get_logs()  # Default limit=50
         assert len(logs) == 50
@@ -327,33 +355,33 @@ class TestGetLogs:
 class TestEdgeCases:
     """Tests for edge cases and error handling."""
     
-    def test_confidence_zero(self, temp_db):
+    def test_confidence_zero(self, mem_db):
         """Test handling of zero confidence."""
-        temp_db.log_detection(
+        mem_db.log_detection(
             image_path="zero.jpg",
             confidence=0.0,
             is_mounting=False,
             details="Zero confidence"
         )
         
-        logs = temp_db.get_logs(limit=1)
+        logs = mem_db.get_logs(limit=1)
         assert logs[0][3] == 0.0
     
-    def test_confidence_one(self, temp_db):
+    def test_confidence_one(self, mem_db):
         """Test handling of 100% confidence."""
-        temp_db.log_detection(
+        mem_db.log_detection(
             image_path="perfect.jpg",
             confidence=1.0,
             is_mounting=True,
             details="Perfect confidence"
         )
         
-        logs = temp_db.get_logs(limit=1)
+        logs = mem_db.get_logs(limit=1)
         assert logs[0][3] == 1.0
     
-    def test_empty_strings(self, temp_db):
+    def test_empty_strings(self, mem_db):
         """Test handling of empty strings."""
-        temp_db.log_detection(
+        mem_db.log_detection(
             image_path="",
             confidence=0.5,
             is_mounting=True,
@@ -361,16 +389,16 @@ class TestEdgeCases:
             barn_id=""
         )
         
-        logs = temp_db.get_logs(limit=1)
+        logs = mem_db.get_logs(limit=1)
         assert logs[0][2] == ""  # image_path
         assert logs[0][5] == ""  # details
         assert logs[0][6] == ""  # barn_id
     
-    def test_long_strings(self, temp_db):
+    def test_long_strings(self, mem_db):
         """Test handling of very long strings."""
         long_string = "A" * 10000
         
-        temp_db.log_detection(
+        mem_db.log_detection(
             image_path=long_string,
             confidence=0.5,
             is_mounting=True,
@@ -378,7 +406,7 @@ class TestEdgeCases:
             barn_id=long_string[:100]
         )
         
-        logs = temp_db.get_logs(limit=1)
+        logs = mem_db.get_logs(limit=1)
         assert len(logs[0][2]) == 10000
         assert len(logs[0][5]) == 10000
     
@@ -389,23 +417,77 @@ class TestEdgeCases:
         # Should still find Barn 1 records
         assert len(logs) == 2
     
-    def test_multiple_database_instances(self):
+    def test_multiple_database_instances(self, tmp_path):
         """Test multiple Database instances on same file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "shared.db"
-            
-            db1 = Database(db_path=db_path)
-            db2 = Database(db_path=db_path)
-            
-            db1.log_detection("test1.jpg", 0.9, True, "From db1", "Barn 1")
-            db2.log_detection("test2.jpg", 0.8, True, "From db2", "Barn 2")
-            
-            # Both should see all records
-            logs1 = db1.get_logs(limit=10)
-            logs2 = db2.get_logs(limit=10)
-            
-            assert len(logs1) == 2
-            assert len(logs2) == 2
+        db_path = tmp_path / "shared.db"
+        
+        db1 = Database(db_path=db_path)
+        db2 = Database(db_path=db_path)
+        
+        db1.log_detection("test1.jpg", 0.9, True, "From db1", "Barn 1")
+        db2.log_detection("test2.jpg", 0.8, True, "From db2", "Barn 2")
+        
+        # Both should see all records
+        logs1 = db1.get_logs(limit=10)
+        logs2 = db2.get_logs(limit=10)
+        
+        assert len(logs1) == 2
+        assert len(logs2) == 2
+
+
+# =============================================================================
+# Tests: Camera Cache
+# =============================================================================
+
+class TestCameraCache:
+    """Tests for get_cameras_cached() invalidation."""
+    
+    def test_cached_cameras_follow_writes(self, temp_db):
+        """Test that add/update/delete invalidate the cached camera list."""
+        assert temp_db.get_cameras_cached() == []
+        
+        cam_id = temp_db.add_camera("Cam 1", "0")
+        assert [c[1] for c in temp_db.get_cameras_cached()] == ["Cam 1"]
+        
+        temp_db.update_camera(cam_id, "Renamed", "0")
+        assert [c[1] for c in temp_db.get_cameras_cached()] == ["Renamed"]
+        
+        temp_db.delete_camera(cam_id)
+        assert temp_db.get_cameras_cached() == []
+    
+    def test_cache_shared_between_instances(self, temp_db):
+        """Test that a write through one instance is seen by another."""
+        other = Database(db_path=temp_db.db_path)
+        assert other.get_cameras_cached() == []
+        
+        temp_db.add_camera("Cam 1", "rtsp://example")
+        
+        assert len(other.get_cameras_cached()) == 1
+    
+    def test_cache_sees_external_writes(self, temp_db):
+        """Test that a camera written through another connection is picked up."""
+        import sqlite3
+        
+        assert temp_db.get_cameras_cached() == []
+        
+        with sqlite3.connect(temp_db.db_path) as conn:
+            conn.execute("INSERT INTO cameras (name, source) VALUES ('Ext', '1')")
+        
+        assert [c[1] for c in temp_db.get_cameras_cached()] == ["Ext"]
+    
+    def test_cache_key_resolves_relative_path(self, temp_db, monkeypatch):
+        """Test that relative and absolute paths to one file share a cache entry."""
+        monkeypatch.chdir(temp_db.db_path.parent)
+        relative = Database(db_path=Path(temp_db.db_path.name))
+        
+        assert relative._cache_key == temp_db._cache_key
+    
+    def test_camera_exists(self, temp_db):
+        """Test lookup of a camera by source."""
+        temp_db.add_camera("Cam 1", "rtsp://example")
+        
+        assert temp_db.camera_exists("rtsp://example") is True
+        assert temp_db.camera_exists("rtsp://other") is False
 
 
 # =============================================================================
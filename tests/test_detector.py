@@ -95,6 +95,16 @@ class TestLoadConfig:
         expected_keys = ["detection", "notification", "storage"]
         for key in expected_keys:
             assert key in config, f"Missing key: {key}"
+    
+    def test_load_config_is_memoized(self):
+        """Test that repeated calls reuse the parsed config until cleared."""
+        from src.detector import load_config
+        
+        assert load_config() is load_config()
+        
+        first = load_config()
+        load_config.cache_clear()
+        assert load_config() is not first
 
 
 # =============================================================================
@@ -270,9 +270,41 @@ class TestUtils:
         from src.utils import get_base_dir
         
         result = get_base_dir()
-        
+
         assert result.exists()
 
+    def test_update_env_file_replaces_and_appends(self):
+        """Test that update_env_file rewrites keys in place and keeps comments."""
+        from dotenv import dotenv_values
+        from src.utils import update_env_file
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            env_path = Path(tmpdir) / ".env"
+            env_path.write_text("# Comment\nSMTP_HOST=old.example.com\nKEEP=1\n")
+
+            update_env_file(env_path, {"SMTP_HOST": "smtp.gmail.com", "NEW_KEY": "it's"})
+
+            content = env_path.read_text()
+            values = dotenv_values(env_path)
+
+            assert content.startswith("# Comment\n")
+            assert values["SMTP_HOST"] == "smtp.gmail.com"
+            assert values["KEEP"] == "1"
+            assert values["NEW_KEY"] == "it's"
+
+    def test_save_yaml_roundtrip_leaves_no_temp_file(self):
+        """Test that save_yaml writes atomically and load_yaml reads it back."""
+        from src.utils import load_yaml, save_yaml
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.yaml"
+            data = {"detection": {"confidence_threshold": 0.5, "target_class": 1}}
+
+            save_yaml(config_path, data)
+
+            assert load_yaml(config_path) == data
+            assert [p.name for p in Path(tmpdir).iterdir()] == ["config.yaml"]
+
 
 # =============================================================================
 # Tests: Logger config (remaining coverage)
@@ -302,6 +334,80 @@ class TestLoggerConfig:
             
             assert logger.name == "CustomLogger"
 
+    def test_enable_queue_logging_swaps_handlers(self):
+        """Test that enable_queue_logging routes records through a queue."""
+        from src.logger_config import setup_logger, enable_queue_logging
+        from logging.handlers import QueueHandler
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "queued.log"
+            logger = setup_logger(name="QueuedLogger", log_path=str(log_path))
+
+            listener = enable_queue_logging("QueuedLogger")
+            logger.info("queued message")
+            listener.stop()
+
+            assert len(logger.handlers) == 1
+            assert isinstance(logger.handlers[0], QueueHandler)
+            assert "queued message" in log_path.read_text(encoding="utf-8")
+
+            for handler in listener.handlers:
+                handler.close()
+
+    def test_buffered_file_handler_flushes_warnings_and_on_close(self):
+        """Test that INFO is buffered while WARNING and close() hit the disk."""
+        from src.logger_config import BufferedRotatingFileHandler
+        import logging
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "buffered.log"
+            handler = BufferedRotatingFileHandler(log_path, flush_interval=60, encoding="utf-8")
+            logger = logging.getLogger("BufferedLogger")
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            logger.addHandler(handler)
+
+            logger.warning("warned")
+            assert "warned" in log_path.read_text(encoding="utf-8")
+
+            logger.warning("info follows")
+            logger.info("buffered")
+            assert "buffered" not in log_path.read_text(encoding="utf-8")
+
+            logger.removeHandler(handler)
+            handler.close()
+            assert "buffered" in log_path.read_text(encoding="utf-8")
+
+    def test_buffered_file_handler_flusher_thread(self):
+        """Test that one background thread writes buffered records on its interval."""
+        from src.logger_config import BufferedRotatingFileHandler
+        import logging
+        import threading
+        import time
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "interval.log"
+            handler = BufferedRotatingFileHandler(log_path, flush_interval=0.05, encoding="utf-8")
+            logger = logging.getLogger("IntervalLogger")
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            logger.addHandler(handler)
+
+            before = threading.active_count()
+            for i in range(20):
+                logger.info("tick %d", i)
+            assert threading.active_count() == before
+
+            deadline = time.monotonic() + 2.0
+            while "tick 19" not in log_path.read_text(encoding="utf-8"):
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+
+            logger.removeHandler(handler)
+            handler.close()
+            handler._flusher.join(timeout=1.0)
+            assert not handler._flusher.is_alive()
+
 
 # =============================================================================
 # Tests: Encryption module (remaining coverage)
@@ -15,6 +15,7 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch, mock_open
 
 import pytest
+import requests
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -63,7 +64,7 @@ class TestDiscordNotifierSend:
             notifier.send("Test message")
             mock_logger.warning.assert_called_once()
     
-    @patch("src.notification.requests.post")
+    @patch("src.notification.requests.Session.post")
     def test_send_message_only(self, mock_post):
         """Test sending message without image."""
         mock_response = MagicMock()
@@ -81,7 +82,7 @@ class TestDiscordNotifierSend:
         assert call_args.kwargs["json"]["content"] == "Test message"
         assert call_args.kwargs["timeout"] == 30
     
-    @patch("src.notification.requests.post")
+    @patch("src.notification.requests.Session.post")
     @patch("builtins.open", mock_open(read_data=b"fake_image_data"))
     @patch("os.path.exists", return_value=True)
     def test_send_with_image(self, mock_exists, mock_post):
@@ -98,13 +99,29 @@ class TestDiscordNotifierSend:
         mock_post.assert_called_once()
         call_args = mock_post.call_args
         assert "files" in call_args.kwargs
-    
-    @patch("src.notification.requests.post")
+
+    @patch("src.notification.requests.Session.post")
+    def test_send_with_image_uploads_bytes(self, mock_post, tmp_path):
+        """Test that the image is read into bytes rather than posted as a handle."""
+        mock_post.return_value = MagicMock(status_code=200)
+        image_path = tmp_path / "small.jpg"
+        image_path.write_bytes(b"jpeg-bytes")
+
+        notifier = DiscordNotifier(webhook_url="https://discord.com/api/webhooks/123/abc")
+        notifier._send_sync("Test message", image_path=str(image_path))
+
+        fname, content, mime = mock_post.call_args.kwargs["files"]["file"]
+        assert (fname, content, mime) == ("small.jpg", b"jpeg-bytes", "image/jpeg")
+
+    @patch("src.notification.requests.Session.post")
     def test_send_handles_error_response(self, mock_post):
         """Test handling of error response from Discord."""
         mock_response = MagicMock()
         mock_response.status_code = 400
         mock_response.text = "Bad Request"
+        mock_response.raise_for_status.side_effect = requests.HTTPError(
+            "400 Client Error", response=mock_response
+        )
         mock_post.return_value = mock_response
         
         webhook = "https://discord.com/api/webhooks/123/abc"
@@ -114,7 +131,7 @@ class TestDiscordNotifierSend:
             notifier._send_sync("Test message")
             mock_logger.error.assert_called_once()
     
-    @patch("src.notification.requests.post")
+    @patch("src.notification.requests.Session.post")
     def test_send_handles_exception(self, mock_post):
         """Test handling of network exception."""
         mock_post.side_effect = Exception("Network error")
@@ -280,9 +297,7 @@ class TestEmailNotifierSend:
     @patch("smtplib.SMTP")
     def test_send_sync_success(self, mock_smtp_class):
         """Test successful email sending."""
-        mock_smtp = MagicMock()
-        mock_smtp_class.return_value.__enter__ = MagicMock(return_value=mock_smtp)
-        mock_smtp_class.return_value.__exit__ = MagicMock(return_value=False)
+        mock_smtp = mock_smtp_class.return_value
         
         notifier = EmailNotifier(
             smtp_user="user@test.com",
@@ -295,17 +310,68 @@ class TestEmailNotifierSend:
         
         mock_smtp.starttls.assert_called_once()
         mock_smtp.login.assert_called_once_with("user@test.com", "password")
-        mock_smtp.send_message.assert_called_once()
+        mock_smtp.sendmail.assert_called_once()
+        from_addr, to_addrs, raw = mock_smtp.sendmail.call_args[0]
+        assert from_addr == "user@test.com"
+        assert to_addrs == ["recipient@test.com"]
+        assert b"Subject: Test Subject" in raw
+    
+    @patch("smtplib.SMTP")
+    def test_send_sync_reuses_connection(self, mock_smtp_class):
+        """Test that consecutive sends share one authenticated connection."""
+        mock_smtp = mock_smtp_class.return_value
+        mock_smtp.noop.return_value = (250, b"OK")
+        
+        notifier = EmailNotifier(
+            smtp_user="user@test.com",
+            smtp_password="password",
+            recipient_email="recipient@test.com"
+        )
+        
+        detections = [{"barn_id": "Barn 1", "confidence": 0.95}]
+        notifier._send_sync("First", detections)
+        notifier._send_sync("Second", detections)
+        
+        mock_smtp_class.assert_called_once()
+        mock_smtp.login.assert_called_once()
+        assert mock_smtp.sendmail.call_count == 2
+        
+        notifier.close()
+        mock_smtp.quit.assert_called_once()
+    
+    @patch("src.notification.time.sleep")
+    @patch("smtplib.SMTP")
+    def test_send_text_retries_dropped_connection(self, mock_smtp_class, mock_sleep):
+        """Test that transient connection failures are retried on a new connection."""
+        import smtplib
+        
+        mock_smtp = mock_smtp_class.return_value
+        mock_smtp.sendmail.side_effect = [
+            smtplib.SMTPServerDisconnected("gone"),
+            smtplib.SMTPServerDisconnected("gone again"),
+            {},
+        ]
+        
+        notifier = EmailNotifier(
+            smtp_user="user@test.com",
+            smtp_password="password",
+            recipient_email="recipient@test.com"
+        )
+        notifier.send_text("Subject", "Body")
+        
+        assert mock_smtp.sendmail.call_count == 3
+        assert mock_smtp_class.call_count == 3
+        mock_smtp_class.assert_called_with(
+            notifier.smtp_host, notifier.smtp_port, timeout=EmailNotifier.SMTP_CONNECT_TIMEOUT
+        )
     
     @patch("smtplib.SMTP")
     def test_send_sync_auth_error(self, mock_smtp_class):
         """Test handling of authentication error."""
         import smtplib
         
-        mock_smtp = MagicMock()
+        mock_smtp = mock_smtp_class.return_value
         mock_smtp.login.side_effect = smtplib.SMTPAuthenticationError(535, b"Auth failed")
-        mock_smtp_class.return_value.__enter__ = MagicMock(return_value=mock_smtp)
-        mock_smtp_class.return_value.__exit__ = MagicMock(return_value=False)
         
         notifier = EmailNotifier(
             smtp_user="user@test.com",
@@ -399,6 +465,27 @@ class TestEmailNotifierSendSingle:
         
         # Should use current time if not provided
         notifier.send_single(barn_id="Barn 1", confidence=0.85)
+    
+    def test_send_single_batches_until_flush(self):
+        """Test that queued detections go out together in one email."""
+        notifier = EmailNotifier(
+            smtp_user="user@test.com",
+            smtp_password="password",
+            recipient_email="recipient@test.com",
+            flush_interval=60,
+        )
+        
+        with patch.object(notifier, "_send_sync") as mock_send:
+            notifier.send_single(barn_id="Barn 1", confidence=0.9)
+            notifier.send_single(barn_id="Barn 2", confidence=0.8)
+            mock_send.assert_not_called()
+            
+            notifier.flush()
+        
+        mock_send.assert_called_once()
+        subject, batch = mock_send.call_args.args
+        assert subject == "[Swine Monitor] 2 Detections"
+        assert [d["barn_id"] for d in batch] == ["Barn 1", "Barn 2"]
 
 
 # =============================================================================
@@ -24,6 +24,7 @@ import pytest
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.notification import EmailNotifier
 from src.notification_scheduler import NotificationScheduler
 
 
@@ -92,7 +93,7 @@ class TestNotificationSchedulerInit:
         assert scheduler.daily_summary_enabled is False
         assert scheduler.daily_summary_time == time(9, 0)
         assert scheduler._running is False
-        assert scheduler._today_detections == []
+        assert len(scheduler._today_detections) == 0
     
     def test_init_with_notifiers(self):
         """Test initialization with email and discord notifiers."""
@@ -249,6 +250,19 @@ class TestDetectionQueuing:
         scheduler._queue_detection(sample_detection)
         assert scheduler.get_pending_count() == 2
     
+    def test_queue_is_capped(self, scheduler, sample_detection):
+        """Test that the daily queue keeps the newest detections up to the cap."""
+        from collections import deque
+        
+        scheduler.daily_cap = 3
+        scheduler._today_detections = deque(maxlen=3)
+        for i in range(5):
+            scheduler._queue_detection({**sample_detection, "confidence": i / 10})
+        
+        assert scheduler.get_pending_count() == 3
+        assert scheduler._dropped_today == 2
+        assert scheduler._today_detections[0]["confidence"] == 0.2
+    
     def test_clear_pending(self, scheduler, sample_detection):
         """Test clearing pending detections."""
         scheduler._queue_detection(sample_detection)
@@ -342,34 +356,97 @@ class TestOnDetection:
         assert len(callback_results) == 1
         assert callback_results[0][0] == "immediate"
         assert len(callback_results[0][1]) == 1
+    
+    def test_on_detection_burst_is_coalesced(self, scheduler_with_mocks, sample_detection):
+        """Test that detections inside the debounce window go out together."""
+        scheduler, mock_email, mock_discord = scheduler_with_mocks
+        scheduler.debounce_seconds = 60
+        
+        for _ in range(3):
+            scheduler.on_detection(sample_detection)
+        
+        # First detection is sent right away, the rest wait for the window
+        assert mock_email.send.call_count == 1
+        assert mock_discord.send.call_count == 1
+        
+        # Flush by hand instead of waiting out the window; cancel the real
+        # timer first so it does not fire later in the session
+        timer = scheduler._burst_timer
+        timer.cancel()
+        timer.join()
+        scheduler._flush_burst()
+        
+        assert mock_email.send.call_count == 2
+        assert mock_discord.send.call_count == 2
+        last_call = mock_email.send.call_args
+        assert last_call.kwargs["subject"] == "[Swine Monitor] 2 Detections"
+        assert len(last_call.kwargs["detections"]) == 2
 
 
 # =============================================================================
-# Tests: _is_target_time
+# Tests: _seconds_until_next_fire
 # =============================================================================
 
-class TestIsTargetTime:
-    """Tests for the _is_target_time method."""
+class TestNextFireTime:
+    """Tests for the _seconds_until_next_fire method."""
     
-    def test_is_target_time_exact_match(self, scheduler):
-        """Test exact time match."""
-        current = time(9, 0)
-        target = time(9, 0)
-        assert scheduler._is_target_time(current, target) is True
+    def test_next_fire_later_today(self, scheduler):
+        """Test target time still ahead today."""
+        scheduler.daily_summary_time = time(9, 0)
+        now = datetime(2026, 2, 9, 8, 30)
+        
+        assert scheduler._seconds_until_next_fire(now=now) == 30 * 60
     
-    def test_is_target_time_within_one_minute(self, scheduler):
-        """Test time within 1 minute tolerance."""
-        target = time(9, 0)
+    def test_next_fire_tomorrow_when_passed(self, scheduler):
+        """Test target time already passed today rolls over to tomorrow."""
+        scheduler.daily_summary_time = time(9, 0)
+        now = datetime(2026, 2, 9, 9, 30)
         
-        assert scheduler._is_target_time(time(8, 59), target) is True
-        assert scheduler._is_target_time(time(9, 1), target) is True
+        assert scheduler._seconds_until_next_fire(now=now) == 23.5 * 3600
     
-    def test_is_target_time_outside_tolerance(self, scheduler):
-        """Test time outside 1 minute tolerance."""
-        target = time(9, 0)
+    def test_next_fire_skips_today_after_sending(self, scheduler):
+        """Test that today's slot is skipped once a summary went out."""
+        scheduler.daily_summary_time = time(9, 0)
+        now = datetime(2026, 2, 9, 8, 59, 59)
         
-        assert scheduler._is_target_time(time(8, 58), target) is False
-        assert scheduler._is_target_time(time(9, 2), target) is False
+        delay = scheduler._seconds_until_next_fire(now.toordinal(), now=now)
+        assert delay == 24 * 3600 + 1
+
+    def test_summary_finishing_after_midnight_keeps_next_day(self, scheduler):
+        """Test that a slow summary running past midnight does not skip the next day."""
+        clock = [datetime(2026, 2, 9, 23, 58, 59, 900000)]
+        last_ordinals = []
+        delays = []
+        next_fire = scheduler._seconds_until_next_fire
+
+        class FakeDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return clock[0]
+
+        def slow_send():
+            clock[0] = datetime(2026, 2, 10, 0, 0, 30)  # SMTP retries ran long
+
+        def recording_next_fire(last_summary_ordinal=0, now=None):
+            last_ordinals.append(last_summary_ordinal)
+            delays.append(next_fire(last_summary_ordinal, now))
+            if len(delays) == 2:
+                scheduler._running = False
+                return 0.0
+            return delays[-1]
+
+        scheduler.daily_summary_enabled = True
+        scheduler.daily_summary_time = time(23, 59)
+        scheduler._send_daily_summary = slow_send
+        scheduler._seconds_until_next_fire = recording_next_fire
+        scheduler._running = True
+        scheduler._wake_event.clear()  # As start() does
+
+        with patch("src.notification_scheduler.datetime", FakeDatetime):
+            scheduler._scheduler_loop()
+
+        assert last_ordinals[1] == datetime(2026, 2, 9).toordinal()
+        assert delays[1] == 23 * 3600 + 58 * 60 + 30
 
 
 # =============================================================================
@@ -413,10 +490,38 @@ class TestSchedulerStartStop:
         
         scheduler.stop()
         
-        # Stop should set _running to False, signaling thread to exit
-        # Note: Thread may still be alive briefly due to sleep intervals (30-60s)
-        # but _running=False guarantees it will exit on next loop iteration
+        # Stop should set _running to False and wake the thread so it exits
         assert scheduler._running is False
+        assert not scheduler._scheduler_thread.is_alive()
+    
+    def test_stop_wakes_disabled_scheduler(self, scheduler):
+        """Test that a thread idling with daily summary disabled exits on stop."""
+        scheduler.daily_summary_enabled = False
+        scheduler.start()
+        time_module.sleep(0.05)  # Let the thread block on the wake event
+        
+        scheduler.stop()
+        
+        assert not scheduler._scheduler_thread.is_alive()
+    
+    def test_assigning_enabled_wakes_disabled_scheduler(self, scheduler):
+        """Test that setting daily_summary_enabled directly re-plans at once."""
+        scheduler.daily_summary_enabled = False
+        planned = threading.Event()
+        next_fire = scheduler._seconds_until_next_fire
+        
+        def recording_next_fire(*args, **kwargs):
+            planned.set()
+            return next_fire(*args, **kwargs)
+        
+        scheduler._seconds_until_next_fire = recording_next_fire
+        scheduler.start()
+        time_module.sleep(0.05)  # Let the thread block on the wake event
+        assert not planned.is_set()
+        
+        scheduler.daily_summary_enabled = True
+        
+        assert planned.wait(2.0)
 
 
 # =============================================================================
@@ -454,6 +559,15 @@ class TestSendTestNotification:
         
         assert results["discord_success"] is False
         assert "not configured" in results["discord_message"].lower()
+    
+    def test_send_test_discord_uses_notifier_session(self, scheduler_with_mocks):
+        """Test that the Discord test message goes through the notifier."""
+        scheduler, mock_email, mock_discord = scheduler_with_mocks
+        
+        results = scheduler.send_test_notification(test_email=False, test_discord=True)
+        
+        mock_discord.send_text.assert_called_once()
+        assert results["discord_success"] is True
 
 
 # =============================================================================
@@ -501,6 +615,27 @@ class TestDailySummary:
         # Email should have been called
         mock_email.send.assert_called()
         assert scheduler.get_pending_count() == 0
+    
+    @patch("smtplib.SMTP")
+    def test_send_daily_summary_without_detections_uses_pooled_email(self, mock_smtp_class):
+        """Test that the no-detection email reuses its pre-encoded template."""
+        email = EmailNotifier(
+            smtp_user="user@test.com",
+            smtp_password="password",
+            recipient_email="recipient@test.com"
+        )
+        scheduler = NotificationScheduler(email_notifier=email)
+        scheduler.email_enabled = True
+        
+        scheduler._send_daily_summary()
+        scheduler._send_daily_summary()
+        
+        mock_smtp = mock_smtp_class.return_value
+        assert mock_smtp.sendmail.call_count == 2
+        payload = mock_smtp.sendmail.call_args[0][2]
+        assert b"No Detections" in payload
+        assert b"{TIMESTAMP}" not in payload
+        assert datetime.now().strftime("%Y-%m-%d").encode() in payload
 
 
 # =============================================================================